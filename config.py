@@ -17,6 +17,9 @@ NORMALIZED_OUTPUT_GOVERNMENT_DIR.mkdir(exist_ok=True)
 
 
 # ==================== Oracle 데이터베이스 설정 ====================
+# 전체 테이블 조회 시 커서 1회 왕복당 가져올 행 수 (arraysize/prefetchrows)
+ORACLE_BULK_FETCH_SIZE = 10000
+
 # 개발/테스트용 BICS_DEV 계정 (CSV 적재용)
 ORACLE_CONFIG = {
     "host": "192.168.73.208",
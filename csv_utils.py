@@ -0,0 +1,160 @@
+"""
+CSV/Parquet 저장 유틸리티
+- pyarrow 설치 시 Arrow CSV writer 사용 (멀티스레드)
+- 출력은 csv.DictWriter(utf-8-sig)와 바이트 단위로 동일
+  (따옴표가 필요한 값이 있거나 Arrow 변환 실패 시 csv.DictWriter로 대체)
+- Parquet은 DB 적재용 중간 파일 (pyarrow 필요, 실패 시 생략)
+- 전체 CSV 읽기는 Arrow CSV reader 사용 (미설치/실패 시 None → 호출 측에서 대체)
+- 파일은 임시 파일에 쓴 뒤 교체 (실패 시 잘린 파일이 남지 않도록)
+- pyarrow는 첫 사용 시점에 지연 임포트
+"""
+
+import csv
+import functools
+import io
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Sequence, Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+UTF8_BOM = '\ufeff'.encode('utf-8')
+
+
+@functools.lru_cache(maxsize=1)
+def _pyarrow():
+    """PyArrow 지연 로드 (선택적) - (pa, pyarrow.csv, pyarrow.parquet), 미설치 시 None"""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    return pa, pacsv, pq
+
+
+def _replace_atomically(path: Path, write: Callable[[Path], None]):
+    """같은 디렉토리의 임시 파일에 write로 기록한 뒤 path로 교체 (실패 시 임시 파일 삭제)"""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _csv_cell(value) -> str:
+    """csv 모듈과 같은 규칙으로 값을 문자열로 변환 (None → '', True → 'True', 2500.0 → '2500.0')"""
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value
+    return str(value)
+
+
+def _write_with_arrow(path: Path, rows: List[Dict[str, Any]], fieldnames: Sequence[str], arrow):
+    """
+    BOM + 헤더(csv 모듈) + 데이터(Arrow) 기록
+
+    모든 값을 csv 모듈과 같은 문자열로 바꾼 뒤 quoting_style='none', eol='\\r\\n'으로 기록하므로
+    결과가 csv.DictWriter와 같다. 따옴표가 필요한 값(쉼표/따옴표/줄바꿈 포함)이 있으면
+    Arrow가 ArrowInvalid를 내므로 호출 측에서 csv 모듈로 대체한다.
+    """
+    pa, pacsv, _ = arrow
+    table = pa.Table.from_pydict({
+        name: pa.array([_csv_cell(row.get(name)) for row in rows], type=pa.string())
+        for name in fieldnames
+    })
+    options = pacsv.WriteOptions(include_header=False, quoting_style='none', eol='\r\n')
+
+    header = io.StringIO()
+    csv.writer(header).writerow(fieldnames)
+
+    with open(path, 'wb') as f:
+        f.write(UTF8_BOM)
+        f.write(header.getvalue().encode('utf-8'))
+        pacsv.write_csv(table, f, write_options=options)
+
+
+def _write_with_csv(path: Path, rows: List[Dict[str, Any]], fieldnames: Sequence[str]):
+    """표준 csv 모듈로 기록 (utf-8-sig)"""
+    with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_dict_rows(path, rows: List[Dict[str, Any]], fieldnames: Sequence[str]):
+    """
+    딕셔너리 리스트를 CSV(utf-8-sig)로 저장
+
+    Args:
+        path: 저장 경로
+        rows: 레코드 리스트
+        fieldnames: 컬럼 순서 (목록에 없는 키는 무시)
+    """
+    path = Path(path)
+    fieldnames = list(fieldnames)
+
+    # 컬럼이 1개면 csv 모듈이 빈 값을 ""로 감싸므로 Arrow 출력과 달라짐
+    arrow = _pyarrow() if len(fieldnames) > 1 else None
+    if arrow is not None:
+        pa = arrow[0]
+        try:
+            _replace_atomically(path, lambda tmp: _write_with_arrow(tmp, rows, fieldnames, arrow))
+            return
+        except TypeError as e:
+            # eol 옵션이 없는 구버전 pyarrow
+            logger.debug(f"Arrow CSV writer 사용 불가, csv 모듈로 대체: {path.name} ({e})")
+        except pa.ArrowException as e:
+            logger.debug(f"Arrow CSV 변환 실패, csv 모듈로 대체: {path.name} ({e})")
+
+    _replace_atomically(path, lambda tmp: _write_with_csv(tmp, rows, fieldnames))
+
+
+def write_parquet_rows(path, rows: List[Dict[str, Any]], fieldnames: Sequence[str]) -> bool:
+    """
+    딕셔너리 리스트를 Parquet(snappy)으로 저장
+
+    저장하지 못하면 이전 실행의 Parquet이 남아 잘못 읽히지 않도록 기존 파일을 삭제한다.
+
+    Returns:
+        저장 성공 여부
+    """
+    path = Path(path)
+
+    arrow = _pyarrow()
+    if arrow is not None:
+        pa, _, pq = arrow
+        try:
+            table = pa.Table.from_pydict({name: [row.get(name) for row in rows] for name in fieldnames})
+            _replace_atomically(path, lambda tmp: pq.write_table(table, tmp, compression='snappy'))
+            return True
+        except pa.ArrowException as e:
+            logger.debug(f"Parquet 변환 실패, 생략: {path.name} ({e})")
+
+    path.unlink(missing_ok=True)
+    return False
+
+
+def read_csv_arrow(path) -> Optional[Any]:
+    """
+    CSV 전체를 Arrow Table로 읽기 (멀티스레드 파싱, BOM 자동 제거)
+
+    TASK_CONTENT 등 따옴표 안 줄바꿈을 허용한다.
+
+    Returns:
+        Arrow Table, pyarrow 미설치 또는 파싱 실패 시 None
+    """
+    arrow = _pyarrow()
+    if arrow is None:
+        return None
+    pa, pacsv, _ = arrow
+    try:
+        return pacsv.read_csv(path, parse_options=pacsv.ParseOptions(newlines_in_values=True))
+    except pa.ArrowException as e:
+        logger.debug(f"Arrow CSV 읽기 실패, pandas로 대체: {Path(path).name} ({e})")
+        return None
@@ -2,12 +2,15 @@
 PDF에서 테이블과 텍스트를 추출하여 JSON으로 변환하는 모듈
 정부/공공기관 문서 구조에 최적화
 """
-import json
+import os
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
 import re
+import traceback
+
+from json_utils import write_json
 
 # 로깅 설정
 logging.basicConfig(
@@ -159,7 +162,11 @@ class GovernmentPDFExtractor:
                 self.stats['total_pages'] = len(pdf.pages)
                 
                 for page_num, page in enumerate(pdf.pages, 1):
-                    page_data = self._process_page(page, page_num)
+                    try:
+                        page_data = self._process_page(page, page_num)
+                    finally:
+                        # 페이지별 레이아웃/문자 캐시 해제 (대용량 PDF 메모리 누적 방지)
+                        page.close()
                     if page_data:
                         result["pages"].append(page_data)
                 
@@ -167,8 +174,7 @@ class GovernmentPDFExtractor:
             
             # JSON 저장
             output_file = self.output_dir / f"{self.pdf_path.stem}.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
+            write_json(output_file, result)
             
             logger.info(f"✅ JSON 저장 완료: {output_file}")
             return result
@@ -382,6 +388,68 @@ def extract_pdf_to_json(pdf_path: str, output_dir: str = None) -> Dict[str, Any]
     return extractor.extract()
 
 
+def _prefetch_file(path: Path, size: int):
+    """커널에 파일 미리 읽기(readahead) 요청 - 파싱 전에 디스크 읽기를 겹쳐 수행 (POSIX 전용)"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        with open(path, 'rb') as f:
+            os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_WILLNEED)
+    except OSError as e:
+        logger.debug(f"posix_fadvise 실패 (무시): {path.name} ({e})")
+
+
+def _stat_or_raise(path: Path, what: str) -> int:
+    """파일 크기 조회 (stat 1회로 존재 확인 겸용)"""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{what}: {path}") from None
+
+
+def extract_pdf_worker(pdf_path: str, output_dir: str) -> Dict[str, Any]:
+    """
+    PDF 1개 → JSON 변환 (프로세스 풀 워커용)
+
+    예외를 밖으로 던지지 않고 결과 딕셔너리로 반환하며,
+    추출 데이터 전체 대신 요약 정보만 돌려줘 프로세스 간 전송량을 줄임
+
+    Args:
+        pdf_path: PDF 파일 경로
+        output_dir: 출력 디렉토리
+
+    Returns:
+        {'file', 'status', 'json_path', 'pages', 'error', 'traceback'}
+    """
+    pdf_path = Path(pdf_path)
+    try:
+        file_size = _stat_or_raise(pdf_path, "PDF 파일이 없습니다")
+        if file_size == 0:
+            raise ValueError(f"PDF 파일이 비어있습니다: {pdf_path}")
+
+        _prefetch_file(pdf_path, file_size)
+        result = extract_pdf_to_json(str(pdf_path), output_dir)
+
+        json_path = Path(output_dir) / f"{pdf_path.stem}.json"
+        if _stat_or_raise(json_path, "JSON 파일이 생성되지 않았습니다") == 0:
+            raise ValueError(f"JSON 파일이 비어있습니다: {json_path}")
+
+        return {
+            'file': pdf_path.name,
+            'status': 'success',
+            'json_path': str(json_path),
+            'pages': len(result.get('pages', []))
+        }
+
+    except Exception as e:
+        return {
+            'file': pdf_path.name,
+            'status': 'failed',
+            'error': str(e),
+            'traceback': traceback.format_exc()
+        }
+
+
 if __name__ == "__main__":
     # 테스트 실행
     import sys
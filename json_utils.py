@@ -0,0 +1,34 @@
+"""
+JSON 읽기/쓰기 유틸리티
+- orjson 설치 시 orjson 사용 (바이트 단위 파싱/직렬화)
+- 미설치 시 표준 json 모듈로 대체
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+# orjson (선택적)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def read_json(path) -> Any:
+    """JSON 파일 로드 (utf-8)"""
+    data = Path(path).read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def write_json(path, obj: Any):
+    """JSON 파일 저장 (utf-8, 들여쓰기 2칸, 한글 그대로 기록)"""
+    path = Path(path)
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
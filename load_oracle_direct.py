@@ -8,10 +8,22 @@ import csv
 import re
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator
+from itertools import islice
 from datetime import datetime
 
+import oracledb
+
 from oracle_db_manager import OracleDBManager
+from csv_utils import write_dict_rows
+from config import ORACLE_BULK_FETCH_SIZE
+
+# PyArrow (선택적 - Parquet 중간 파일 읽기)
+try:
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # 로깅 설정
 logging.basicConfig(
@@ -20,20 +32,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 조회 커서 1회 왕복당 가져올 행 수 (PLAN_DATA 매칭 조회와 같은 값 사용)
+READ_ARRAYSIZE = ORACLE_BULK_FETCH_SIZE
+
+# INSERT 바인드 타입 (ID는 CHAR(30), 연도/금액/수치는 NUMBER, 나머지 None은 드라이버 추론)
+ID_SIZE = 30
+NUMBER = oracledb.DB_TYPE_NUMBER
+
 
 class OracleDirectLoader:
     """Oracle DB 직접 적재 클래스"""
 
-    def __init__(self, db_config_read: Dict, db_config_write: Dict, csv_dir: str):
+    def __init__(self, db_config_read: Dict, db_config_write: Dict, csv_dir: str,
+                 chunk_size: int = 50000):
         """
         Args:
             db_config_read: 읽기용 DB 설정 (BICS - TB_PLAN_DATA 조회)
             db_config_write: 쓰기용 DB 설정 (BICS_DEV - 하위 테이블 적재)
             csv_dir: CSV 파일 디렉토리
+            chunk_size: executemany 1회당 INSERT 행 수
         """
         self.db_config_read = db_config_read
         self.db_config_write = db_config_write
         self.csv_dir = Path(csv_dir)
+        self.chunk_size = chunk_size
         
         self.db_manager_read = None  # BICS (읽기)
         self.db_manager_write = None  # BICS_DEV (쓰기)
@@ -82,6 +104,8 @@ class OracleDirectLoader:
         
         try:
             cursor = self.db_manager_read.connection.cursor()
+            cursor.arraysize = READ_ARRAYSIZE
+            cursor.prefetchrows = READ_ARRAYSIZE
             query = """
                 SELECT PLAN_ID, YEAR, BIZ_NM, DETAIL_BIZ_NM
                 FROM TB_PLAN_DATA
@@ -166,18 +190,19 @@ class OracleDirectLoader:
         logger.info("📋 TB_PLAN_DATA 복사 확인 중...")
         
         try:
-            # BICS_DEV에 TB_PLAN_DATA 레코드 수 확인
+            # BICS_DEV에 TB_PLAN_DATA 레코드 존재 여부 확인 (전체 COUNT 대신 첫 행만 확인)
             cursor_write = self.db_manager_write.connection.cursor()
-            cursor_write.execute("SELECT COUNT(*) FROM TB_PLAN_DATA")
-            dev_count = cursor_write.fetchone()[0]
+            cursor_write.execute("SELECT 1 FROM TB_PLAN_DATA WHERE ROWNUM = 1")
             
-            if dev_count > 0:
-                logger.info(f"✅ BICS_DEV.TB_PLAN_DATA 이미 존재: {dev_count}건")
+            if cursor_write.fetchone():
+                logger.info("✅ BICS_DEV.TB_PLAN_DATA 이미 존재")
                 cursor_write.close()
                 return
             
             # BICS에서 데이터 조회
             cursor_read = self.db_manager_read.connection.cursor()
+            cursor_read.arraysize = READ_ARRAYSIZE
+            cursor_read.prefetchrows = READ_ARRAYSIZE
             cursor_read.execute("SELECT * FROM TB_PLAN_DATA WHERE DELETE_YN = 'N'")
             
             # 컬럼명 가져오기
@@ -201,20 +226,47 @@ class OracleDirectLoader:
             logger.error(f"❌ TB_PLAN_DATA 복사 실패: {e}")
             # 실패해도 계속 진행 (이미 존재할 수 있음)
 
-    def _read_csv(self, filename: str) -> List[Dict]:
-        """CSV 파일 읽기"""
+    def _iter_csv(self, filename: str) -> Iterator[Dict]:
+        """CSV 파일을 한 행씩 읽기 (전체를 메모리에 올리지 않음)"""
         csv_path = self.csv_dir / filename
         if not csv_path.exists():
             logger.warning(f"⚠️ CSV 파일 없음: {filename}")
-            return []
-        
+            return
+
         try:
             with open(csv_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                return list(reader)
+                yield from csv.DictReader(f)
         except Exception as e:
             logger.error(f"❌ CSV 읽기 실패 {filename}: {e}")
-            return []
+
+    def _read_csv(self, filename: str) -> List[Dict]:
+        """CSV 파일 읽기"""
+        return list(self._iter_csv(filename))
+
+    def _iter_table(self, table: str) -> Iterator[Dict]:
+        """
+        테이블 행 읽기 - 정규화 단계에서 만든 Parquet이 있으면 우선 사용, 없으면 CSV
+
+        Parquet은 타입이 보존되어 문자열 재파싱이 없고 chunk_size 단위 배치로 읽는다.
+        CSV가 더 최근에 수정된 경우(수동 편집 등)에는 CSV를 사용한다.
+        """
+        parquet_path = self.csv_dir / f"{table}.parquet"
+        csv_path = self.csv_dir / f"{table}.csv"
+
+        parquet_file = None
+        if PYARROW_AVAILABLE and parquet_path.exists():
+            if not csv_path.exists() or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+                try:
+                    parquet_file = pq.ParquetFile(parquet_path)
+                except Exception as e:
+                    logger.warning(f"⚠️ Parquet 읽기 실패, CSV 사용 {parquet_path.name}: {e}")
+
+        if parquet_file is None:
+            yield from self._iter_csv(f"{table}.csv")
+            return
+
+        for batch in parquet_file.iter_batches(batch_size=self.chunk_size):
+            yield from batch.to_pylist()
 
     def _generate_id(self, prefix: str, year: int, seq: int) -> str:
         """ID 생성 (CHAR(30) 포맷)"""
@@ -222,215 +274,221 @@ class OracleDirectLoader:
         id_str = f"{prefix}_{year}_{seq:06d}"
         return id_str.ljust(30)[:30]
 
-    def _load_budget(self, records: List[Dict]) -> int:
-        """TB_PLAN_BUDGET 적재"""
-        if not records:
+    @staticmethod
+    def _safe_float(val) -> Optional[float]:
+        """숫자 변환 (실패 시 None)"""
+        try:
+            if val and str(val).strip():
+                return float(str(val).replace(',', ''))
+        except (ValueError, TypeError):
+            pass
+        return None
+
+    def _insert_rows(self, sql: str, rows: Iterable[tuple], table: str,
+                     input_sizes: Optional[Tuple] = None) -> int:
+        """
+        배열 DML(executemany)로 chunk_size 단위 일괄 INSERT
+
+        rows는 이터레이터로 받아 chunk_size만큼씩만 메모리에 올린다.
+        batcherrors=True로 실행하여 오류 행만 건너뛰고 나머지는 적재하며,
+        테이블 단위로 한 번만 커밋한다.
+        input_sizes를 주면 setinputsizes로 바인드 타입을 미리 고정하여
+        첫 행이 None인 컬럼 등에서 생기는 타입 추론/재바인드를 피한다.
+
+        Returns:
+            적재 성공 건수
+        """
+        rows = iter(rows)
+        chunk = list(islice(rows, self.chunk_size))
+        if not chunk:
             return 0
-        
+
         cursor = self.db_manager_write.connection.cursor()
+        if input_sizes:
+            cursor.setinputsizes(*input_sizes)
         loaded = 0
-        
-        for idx, record in enumerate(records, 1):
-            try:
-                plan_id = record.get('PLAN_ID', '').strip()
-                if not plan_id or plan_id.startswith('TEMP_'):
-                    continue
-                
-                budget_year = record.get('BUDGET_YEAR')
-                if not budget_year:
-                    continue
-                
-                budget_id = self._generate_id('BUD', int(budget_year), idx)
-                
-                sql = """
-                    INSERT INTO TB_PLAN_BUDGET (
-                        BUDGET_ID, PLAN_ID, BUDGET_YEAR, CATEGORY,
-                        TOTAL_AMOUNT, GOV_AMOUNT, PRIVATE_AMOUNT, LOCAL_AMOUNT, ETC_AMOUNT
-                    ) VALUES (
-                        :1, :2, :3, :4, :5, :6, :7, :8, :9
-                    )
-                """
-                
-                def safe_float(val):
-                    try:
-                        if val and str(val).strip():
-                            return float(str(val).replace(',', ''))
-                    except:
-                        pass
-                    return None
-                
-                cursor.execute(sql, (
-                    budget_id,
-                    plan_id.ljust(30)[:30],
-                    int(budget_year),
-                    record.get('CATEGORY', '계획'),
-                    safe_float(record.get('TOTAL_AMOUNT')),
-                    safe_float(record.get('GOV_AMOUNT')),
-                    safe_float(record.get('PRIVATE_AMOUNT')),
-                    safe_float(record.get('LOCAL_AMOUNT')),
-                    safe_float(record.get('ETC_AMOUNT'))
-                ))
-                loaded += 1
-                
-            except Exception as e:
-                logger.debug(f"Budget 적재 실패: {e}")
-                continue
-        
+        start = 0
+
+        while chunk:
+            cursor.executemany(sql, chunk, batcherrors=True)
+
+            errors = cursor.getbatcherrors()
+            for error in errors:
+                logger.debug(f"{table} 적재 실패 (행 {start + error.offset + 1}): {error.message}")
+            loaded += len(chunk) - len(errors)
+
+            start += len(chunk)
+            chunk = list(islice(rows, self.chunk_size))
+
         self.db_manager_write.connection.commit()
         cursor.close()
         return loaded
 
-    def _load_schedule(self, records: List[Dict]) -> int:
-        """TB_PLAN_SCHEDULE 적재"""
-        if not records:
-            return 0
-        
-        cursor = self.db_manager_write.connection.cursor()
-        loaded = 0
-        
-        for idx, record in enumerate(records, 1):
-            try:
-                plan_id = record.get('PLAN_ID', '').strip()
-                if not plan_id or plan_id.startswith('TEMP_'):
-                    continue
-                
-                schedule_year = record.get('SCHEDULE_YEAR')
-                if not schedule_year:
-                    continue
-                
-                schedule_id = self._generate_id('SCH', int(schedule_year), idx)
-                
-                sql = """
-                    INSERT INTO TB_PLAN_SCHEDULE (
-                        SCHEDULE_ID, PLAN_ID, SCHEDULE_YEAR, QUARTER,
-                        TASK_NAME, TASK_CONTENT, START_DATE, END_DATE
-                    ) VALUES (
-                        :1, :2, :3, :4, :5, :6, TO_DATE(:7, 'YYYY-MM-DD'), TO_DATE(:8, 'YYYY-MM-DD')
+    def _load_budget(self, records: Iterable[Dict]) -> int:
+        """TB_PLAN_BUDGET 적재"""
+        sql = """
+            INSERT INTO TB_PLAN_BUDGET (
+                BUDGET_ID, PLAN_ID, BUDGET_YEAR, CATEGORY,
+                TOTAL_AMOUNT, GOV_AMOUNT, PRIVATE_AMOUNT, LOCAL_AMOUNT, ETC_AMOUNT
+            ) VALUES (
+                :1, :2, :3, :4, :5, :6, :7, :8, :9
+            )
+        """
+
+        def build_rows():
+            for idx, record in enumerate(records, 1):
+                try:
+                    plan_id = record.get('PLAN_ID', '').strip()
+                    if not plan_id or plan_id.startswith('TEMP_'):
+                        continue
+
+                    budget_year = record.get('BUDGET_YEAR')
+                    if not budget_year:
+                        continue
+
+                    budget_id = self._generate_id('BUD', int(budget_year), idx)
+
+                    yield (
+                        budget_id,
+                        plan_id.ljust(30)[:30],
+                        int(budget_year),
+                        record.get('CATEGORY', '계획'),
+                        self._safe_float(record.get('TOTAL_AMOUNT')),
+                        self._safe_float(record.get('GOV_AMOUNT')),
+                        self._safe_float(record.get('PRIVATE_AMOUNT')),
+                        self._safe_float(record.get('LOCAL_AMOUNT')),
+                        self._safe_float(record.get('ETC_AMOUNT'))
                     )
-                """
-                
-                cursor.execute(sql, (
-                    schedule_id,
-                    plan_id.ljust(30)[:30],
-                    int(schedule_year),
-                    record.get('QUARTER', ''),
-                    (record.get('TASK_NAME') or '')[:768],
-                    (record.get('TASK_CONTENT') or '')[:4000],
-                    record.get('START_DATE'),
-                    record.get('END_DATE')
-                ))
-                loaded += 1
-                
-            except Exception as e:
-                logger.debug(f"Schedule 적재 실패: {e}")
-                continue
-        
-        self.db_manager_write.connection.commit()
-        cursor.close()
-        return loaded
 
-    def _load_performance(self, records: List[Dict]) -> int:
-        """TB_PLAN_PERFORMANCE 적재"""
-        if not records:
-            return 0
-        
-        cursor = self.db_manager_write.connection.cursor()
-        loaded = 0
-        
-        for idx, record in enumerate(records, 1):
-            try:
-                plan_id = record.get('PLAN_ID', '').strip()
-                if not plan_id or plan_id.startswith('TEMP_'):
+                except Exception as e:
+                    logger.debug(f"Budget 적재 실패: {e}")
                     continue
-                
-                perf_year = record.get('PERFORMANCE_YEAR')
-                if not perf_year:
-                    continue
-                
-                perf_id = self._generate_id('PRF', int(perf_year), idx)
-                
-                sql = """
-                    INSERT INTO TB_PLAN_PERFORMANCE (
-                        PERFORMANCE_ID, PLAN_ID, PERFORMANCE_YEAR, PERFORMANCE_TYPE,
-                        CATEGORY, VALUE, UNIT, ORIGINAL_TEXT
-                    ) VALUES (
-                        :1, :2, :3, :4, :5, :6, :7, :8
+
+        input_sizes = (ID_SIZE, ID_SIZE, NUMBER, None, NUMBER, NUMBER, NUMBER, NUMBER, NUMBER)
+        return self._insert_rows(sql, build_rows(), 'TB_PLAN_BUDGET', input_sizes)
+
+    def _load_schedule(self, records: Iterable[Dict]) -> int:
+        """TB_PLAN_SCHEDULE 적재"""
+        sql = """
+            INSERT INTO TB_PLAN_SCHEDULE (
+                SCHEDULE_ID, PLAN_ID, SCHEDULE_YEAR, QUARTER,
+                TASK_NAME, TASK_CONTENT, START_DATE, END_DATE
+            ) VALUES (
+                :1, :2, :3, :4, :5, :6, TO_DATE(:7, 'YYYY-MM-DD'), TO_DATE(:8, 'YYYY-MM-DD')
+            )
+        """
+
+        def build_rows():
+            for idx, record in enumerate(records, 1):
+                try:
+                    plan_id = record.get('PLAN_ID', '').strip()
+                    if not plan_id or plan_id.startswith('TEMP_'):
+                        continue
+
+                    schedule_year = record.get('SCHEDULE_YEAR')
+                    if not schedule_year:
+                        continue
+
+                    schedule_id = self._generate_id('SCH', int(schedule_year), idx)
+
+                    yield (
+                        schedule_id,
+                        plan_id.ljust(30)[:30],
+                        int(schedule_year),
+                        record.get('QUARTER', ''),
+                        (record.get('TASK_NAME') or '')[:768],
+                        (record.get('TASK_CONTENT') or '')[:4000],
+                        record.get('START_DATE'),
+                        record.get('END_DATE')
                     )
-                """
-                
-                def safe_float(val):
-                    try:
-                        if val and str(val).strip():
-                            return float(str(val).replace(',', ''))
-                    except:
-                        pass
-                    return None
-                
-                cursor.execute(sql, (
-                    perf_id,
-                    plan_id.ljust(30)[:30],
-                    int(perf_year),
-                    (record.get('PERFORMANCE_TYPE') or '')[:100],
-                    (record.get('CATEGORY') or '')[:200],
-                    safe_float(record.get('VALUE')),
-                    (record.get('UNIT') or '')[:50],
-                    (record.get('ORIGINAL_TEXT') or '')[:4000]
-                ))
-                loaded += 1
-                
-            except Exception as e:
-                logger.debug(f"Performance 적재 실패: {e}")
-                continue
-        
-        self.db_manager_write.connection.commit()
-        cursor.close()
-        return loaded
 
-    def _load_achievements(self, records: List[Dict]) -> int:
-        """TB_PLAN_ACHIEVEMENTS 적재"""
-        if not records:
-            return 0
-        
-        cursor = self.db_manager_write.connection.cursor()
-        loaded = 0
-        
-        for idx, record in enumerate(records, 1):
-            try:
-                plan_id = record.get('PLAN_ID', '').strip()
-                if not plan_id or plan_id.startswith('TEMP_'):
+                except Exception as e:
+                    logger.debug(f"Schedule 적재 실패: {e}")
                     continue
-                
-                ach_year = record.get('ACHIEVEMENT_YEAR')
-                if not ach_year:
+
+        input_sizes = (ID_SIZE, ID_SIZE, NUMBER, None, None, None, None, None)
+        return self._insert_rows(sql, build_rows(), 'TB_PLAN_SCHEDULE', input_sizes)
+
+    def _load_performance(self, records: Iterable[Dict]) -> int:
+        """TB_PLAN_PERFORMANCE 적재"""
+        sql = """
+            INSERT INTO TB_PLAN_PERFORMANCE (
+                PERFORMANCE_ID, PLAN_ID, PERFORMANCE_YEAR, PERFORMANCE_TYPE,
+                CATEGORY, VALUE, UNIT, ORIGINAL_TEXT
+            ) VALUES (
+                :1, :2, :3, :4, :5, :6, :7, :8
+            )
+        """
+
+        def build_rows():
+            for idx, record in enumerate(records, 1):
+                try:
+                    plan_id = record.get('PLAN_ID', '').strip()
+                    if not plan_id or plan_id.startswith('TEMP_'):
+                        continue
+
+                    perf_year = record.get('PERFORMANCE_YEAR')
+                    if not perf_year:
+                        continue
+
+                    perf_id = self._generate_id('PRF', int(perf_year), idx)
+
+                    yield (
+                        perf_id,
+                        plan_id.ljust(30)[:30],
+                        int(perf_year),
+                        (record.get('PERFORMANCE_TYPE') or '')[:100],
+                        (record.get('CATEGORY') or '')[:200],
+                        self._safe_float(record.get('VALUE')),
+                        (record.get('UNIT') or '')[:50],
+                        (record.get('ORIGINAL_TEXT') or '')[:4000]
+                    )
+
+                except Exception as e:
+                    logger.debug(f"Performance 적재 실패: {e}")
                     continue
-                
-                ach_id = self._generate_id('ACH', int(ach_year), idx)
-                
-                sql = """
-                    INSERT INTO TB_PLAN_ACHIEVEMENTS (
-                        ACHIEVEMENT_ID, PLAN_ID, ACHIEVEMENT_YEAR,
-                        ACHIEVEMENT_ORDER, DESCRIPTION
-                    ) VALUES (
-                        :1, :2, :3, :4, :5
+
+        input_sizes = (ID_SIZE, ID_SIZE, NUMBER, None, None, NUMBER, None, None)
+        return self._insert_rows(sql, build_rows(), 'TB_PLAN_PERFORMANCE', input_sizes)
+
+    def _load_achievements(self, records: Iterable[Dict]) -> int:
+        """TB_PLAN_ACHIEVEMENTS 적재"""
+        sql = """
+            INSERT INTO TB_PLAN_ACHIEVEMENTS (
+                ACHIEVEMENT_ID, PLAN_ID, ACHIEVEMENT_YEAR,
+                ACHIEVEMENT_ORDER, DESCRIPTION
+            ) VALUES (
+                :1, :2, :3, :4, :5
+            )
+        """
+
+        def build_rows():
+            for idx, record in enumerate(records, 1):
+                try:
+                    plan_id = record.get('PLAN_ID', '').strip()
+                    if not plan_id or plan_id.startswith('TEMP_'):
+                        continue
+
+                    ach_year = record.get('ACHIEVEMENT_YEAR')
+                    if not ach_year:
+                        continue
+
+                    ach_id = self._generate_id('ACH', int(ach_year), idx)
+
+                    yield (
+                        ach_id,
+                        plan_id.ljust(30)[:30],
+                        int(ach_year),
+                        record.get('ACHIEVEMENT_ORDER', idx),
+                        (record.get('DESCRIPTION') or '')[:4000]
                     )
-                """
-                
-                cursor.execute(sql, (
-                    ach_id,
-                    plan_id.ljust(30)[:30],
-                    int(ach_year),
-                    record.get('ACHIEVEMENT_ORDER', idx),
-                    (record.get('DESCRIPTION') or '')[:4000]
-                ))
-                loaded += 1
-                
-            except Exception as e:
-                logger.debug(f"Achievement 적재 실패: {e}")
-                continue
-        
-        self.db_manager_write.connection.commit()
-        cursor.close()
-        return loaded
+
+                except Exception as e:
+                    logger.debug(f"Achievement 적재 실패: {e}")
+                    continue
+
+        input_sizes = (ID_SIZE, ID_SIZE, NUMBER, None, None)
+        return self._insert_rows(sql, build_rows(), 'TB_PLAN_ACHIEVEMENTS', input_sizes)
 
     def _generate_matching_report(self, plan_data: List[Dict]):
         """매칭 리포트 생성"""
@@ -469,52 +527,80 @@ class OracleDirectLoader:
         
         # 매칭 리포트 저장
         if matched_records:
-            with open(report_dir / "matching_report.csv", 'w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=['csv_index', 'year', 'biz_nm', 'detail_biz_nm', 'plan_id', 'status'])
-                writer.writeheader()
-                writer.writerows(matched_records)
-        
+            write_dict_rows(report_dir / "matching_report.csv", matched_records,
+                            ['csv_index', 'year', 'biz_nm', 'detail_biz_nm', 'plan_id', 'status'])
+
         # 매칭 실패 리포트 저장
         if unmatched_records:
-            with open(report_dir / "unmatched_records.csv", 'w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=['csv_index', 'year', 'biz_nm', 'detail_biz_nm', 'plan_id', 'reason'])
-                writer.writeheader()
-                writer.writerows(unmatched_records)
-        
+            write_dict_rows(report_dir / "unmatched_records.csv", unmatched_records,
+                            ['csv_index', 'year', 'biz_nm', 'detail_biz_nm', 'plan_id', 'reason'])
+
         logger.info(f"📊 매칭 리포트 생성: {report_dir}")
         logger.info(f"   - 매칭 성공: {len(matched_records)}건")
         logger.info(f"   - 매칭 실패: {len(unmatched_records)}건")
 
     def load_with_matching(self):
-        """매칭 기반 데이터 적재 (메인 메서드)"""
+        """매칭 기반 데이터 적재 (메인 메서드) - csv_dir의 정규화 결과 파일을 읽어 적재"""
+        # 정규화 결과 읽기 (Parquet 우선, 하위 테이블은 적재 시점에 스트리밍)
+        self._load_tables(
+            plan_data=list(self._iter_table("TB_PLAN_DATA")),
+            budgets=self._iter_table("TB_PLAN_BUDGET"),
+            schedules=self._iter_table("TB_PLAN_SCHEDULE"),
+            performances=self._iter_table("TB_PLAN_PERFORMANCE"),
+            achievements=self._iter_table("TB_PLAN_ACHIEVEMENTS"),
+            source="CSV 파일"
+        )
+
+    def load_from_dict(self, data: Dict[str, List[Dict]]):
+        """
+        매칭 기반 데이터 적재 - 정규화 결과(normalizer.data)를 메모리에서 바로 적재
+
+        같은 실행에서 정규화한 데이터를 CSV로 다시 읽어 파싱하지 않는다.
+
+        Args:
+            data: GovernmentStandardNormalizer.data ('plan_data', 'budgets', 'schedules',
+                  'performances', 'achievements' 키의 레코드 리스트)
+        """
+        self._load_tables(
+            plan_data=data.get('plan_data', []),
+            budgets=data.get('budgets', []),
+            schedules=data.get('schedules', []),
+            performances=data.get('performances', []),
+            achievements=data.get('achievements', []),
+            source="정규화 데이터"
+        )
+
+    def _load_tables(self, plan_data: List[Dict], budgets: Iterable[Dict],
+                     schedules: Iterable[Dict], performances: Iterable[Dict],
+                     achievements: Iterable[Dict], source: str):
+        """매칭 리포트 생성 + 하위 테이블 적재 (load_with_matching/load_from_dict 공통)"""
         logger.info("\n" + "=" * 80)
         logger.info("🚀 매칭 기반 데이터 적재 시작")
         logger.info("=" * 80)
-        
+
+        # 연결을 재사용하는 경우 이전 실행 결과 초기화
+        self.existing_plan_data = {}
+        self.load_stats = {
+            'total_records': 0,
+            'matched': 0,
+            'unmatched': 0,
+            'diff_found': 0,
+            'records_by_table': {}
+        }
+
         # 1. 기존 PLAN_DATA 로드
         self._load_existing_plan_data()
         
         # 2. TB_PLAN_DATA 복사 (BICS → BICS_DEV)
         self._copy_plan_data_to_dev()
         
-        # 3. CSV 파일 읽기
-        plan_data = self._read_csv("TB_PLAN_DATA.csv")
-        budgets = self._read_csv("TB_PLAN_BUDGET.csv")
-        schedules = self._read_csv("TB_PLAN_SCHEDULE.csv")
-        performances = self._read_csv("TB_PLAN_PERFORMANCE.csv")
-        achievements = self._read_csv("TB_PLAN_ACHIEVEMENTS.csv")
-        
-        logger.info(f"\n📂 CSV 파일 로드:")
+        logger.info(f"\n📂 {source} 로드:")
         logger.info(f"   - TB_PLAN_DATA: {len(plan_data)}건")
-        logger.info(f"   - TB_PLAN_BUDGET: {len(budgets)}건")
-        logger.info(f"   - TB_PLAN_SCHEDULE: {len(schedules)}건")
-        logger.info(f"   - TB_PLAN_PERFORMANCE: {len(performances)}건")
-        logger.info(f"   - TB_PLAN_ACHIEVEMENTS: {len(achievements)}건")
         
-        # 4. 매칭 리포트 생성
+        # 3. 매칭 리포트 생성
         self._generate_matching_report(plan_data)
         
-        # 5. 하위 테이블 적재
+        # 4. 하위 테이블 적재
         logger.info("\n📥 하위 테이블 적재 중...")
         
         budget_count = self._load_budget(budgets)
@@ -533,7 +619,7 @@ class OracleDirectLoader:
         self.load_stats['records_by_table']['TB_PLAN_ACHIEVEMENTS'] = achievement_count
         logger.info(f"   ✅ TB_PLAN_ACHIEVEMENTS: {achievement_count}건")
         
-        # 6. 총 적재 레코드 계산
+        # 5. 총 적재 레코드 계산
         self.load_stats['total_records'] = (
             budget_count + schedule_count + performance_count + achievement_count
         )
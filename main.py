@@ -11,12 +11,13 @@ PDF → JSON → 정규화 → Oracle DB 적재 파이프라인
 
 import sys
 import io
-import json
-import re
 from pathlib import Path
 import logging
 from datetime import datetime
 from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import os
 import argparse
 
 # UTF-8 출력 설정 (Windows cp949 에러 방지)
@@ -27,7 +28,12 @@ if sys.stderr.encoding != 'utf-8':
 
 # 핵심 모듈
 from extract_pdf_to_json import extract_pdf_to_json
-from normalize_government_standard import GovernmentStandardNormalizer
+from normalize_government_standard import (
+    GovernmentStandardNormalizer,
+    load_existing_plan_data,
+    init_normalize_worker,
+    normalize_json_file,
+)
 from config import (
     INPUT_DIR,
     OUTPUT_DIR,
@@ -72,6 +78,9 @@ class PDFtoDBPipeline:
         self.output_dir.mkdir(exist_ok=True)
         self.normalized_dir.mkdir(exist_ok=True)
 
+        # 정규화 결과 (normalize_all 후 DB 적재에 사용)
+        self.normalized_data = None
+
         # 통계
         self.stats = {
             'start_time': datetime.now(),
@@ -100,13 +109,14 @@ class PDFtoDBPipeline:
             except Exception as e:
                 logger.warning(f"삭제 실패 {file}: {e}")
 
-        # CSV 파일 삭제
-        for file in self.normalized_dir.glob("*.csv"):
-            try:
-                file.unlink()
-                cleaned += 1
-            except Exception as e:
-                logger.warning(f"삭제 실패 {file}: {e}")
+        # CSV / Parquet(DB 적재용 중간 파일) 삭제
+        for pattern in ("*.csv", "*.parquet"):
+            for file in self.normalized_dir.glob(pattern):
+                try:
+                    file.unlink()
+                    cleaned += 1
+                except Exception as e:
+                    logger.warning(f"삭제 실패 {file}: {e}")
 
         logger.info(f"✅ {cleaned}개 파일 정리 완료\n")
 
@@ -140,8 +150,9 @@ class PDFtoDBPipeline:
         logger.info("2️⃣ 데이터 정규화")
         logger.info("=" * 60)
 
-        json_files = list(self.output_dir.glob("*.json"))
-        json_files = [f for f in json_files if not f.name.startswith('batch_')]
+        json_files = sorted(
+            f for f in self.output_dir.glob("*.json") if not f.name.startswith('batch_')
+        )
 
         if not json_files:
             logger.error(f"❌ {self.output_dir}에 JSON 파일이 없습니다.")
@@ -149,59 +160,57 @@ class PDFtoDBPipeline:
 
         logger.info(f"📂 {len(json_files)}개 JSON 파일 발견")
 
-        # JSON 데이터 로드
-        all_json_data = []
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    json_data = json.load(f)
-                    all_json_data.append((json_file, json_data))
-            except Exception as e:
-                logger.error(f"JSON 로드 실패 {json_file.name}: {e}")
-
-        if not all_json_data:
-            logger.error("로드된 JSON이 없습니다.")
-            return False
-
-        # DB 연결 (PLAN_ID 매칭용)
-        db_manager = None
+        # 기존 PLAN_DATA 일괄 조회 (PLAN_ID 매칭용) - 정규화 전에 한 번만 조회
+        existing_plan_data = {}
         if not self.skip_db and DB_AVAILABLE:
+            db_manager = None
             try:
                 db_manager = OracleDBManager(ORACLE_CONFIG)
                 db_manager.connect()
-                logger.info("🔗 DB 연결 (PLAN_ID 매칭용)")
+                existing_plan_data = load_existing_plan_data(db_manager)
+                logger.info(f"🔗 DB 연결 (PLAN_ID 매칭용, 기존 {len(existing_plan_data):,}건)")
             except Exception as e:
                 logger.warning(f"⚠️ DB 연결 실패: {e}")
-                db_manager = None
+            finally:
+                if db_manager:
+                    db_manager.close()
 
-        # Normalizer 초기화
+        # 결과 병합용 normalizer
         normalizer = GovernmentStandardNormalizer(
             str(json_files[0]),
             str(self.normalized_dir),
-            db_manager=db_manager
+            existing_plan_data={}
         )
 
-        # 각 JSON 파일 처리
-        for json_file, json_data in all_json_data:
-            logger.info(f"📋 정규화 중: {json_file.name}")
-
-            # 파일명에서 연도 추출
-            year_match = re.search(r'(20\d{2})', json_file.stem)
-            if year_match:
-                doc_year = int(year_match.group(1))
-                normalizer.current_context['document_year'] = doc_year
-                normalizer.current_context['performance_year'] = doc_year - 1
-                normalizer.current_context['plan_year'] = doc_year
-                logger.info(f"   📅 연도: {doc_year}년")
-
-            normalizer.normalize(json_data)
+        # Streamlit 앱과 같은 경로: 파일별 정규화(프로세스 풀) → 파일 순서대로 병합
+        max_workers = min(os.cpu_count() or 1, len(json_files))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=init_normalize_worker,
+            initargs=(existing_plan_data,)
+        ) as executor:
+            results = executor.map(
+                normalize_json_file,
+                [str(f) for f in json_files],
+                repeat(str(self.normalized_dir))
+            )
+            merged = 0
+            for json_file, result in zip(json_files, results):
+                if result['status'] != 'success':
+                    logger.error(f"❌ 정규화 실패 {json_file.name}: {result.get('error')}")
+                    continue
+                logger.info(f"📋 정규화 완료: {json_file.name}")
+                normalizer.merge(result['data'])
+                merged += 1
+
+        if not merged:
+            logger.error("정규화된 JSON이 없습니다.")
+            return False
 
         # CSV 저장
         normalizer.save_to_csv()
-
-        # DB 연결 종료
-        if db_manager:
-            db_manager.close()
+        # DB 적재 단계에서 CSV를 다시 읽지 않도록 정규화 결과 보관
+        self.normalized_data = normalizer.data
 
         # 통계 업데이트
         for table_name, records in normalizer.data.items():
@@ -240,7 +249,10 @@ class PDFtoDBPipeline:
             logger.info("   2️⃣ CSV와 매칭 (YEAR + BIZ_NM + DETAIL_BIZ_NM)")
             logger.info("   3️⃣ 하위 테이블 적재 → BICS_DEV")
 
-            loader.load_with_matching()
+            if self.normalized_data is not None:
+                loader.load_from_dict(self.normalized_data)
+            else:
+                loader.load_with_matching()
 
             # 통계
             stats = loader.load_stats
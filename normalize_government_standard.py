@@ -1,11 +1,15 @@
 ﻿import json
-import csv
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from fuzzywuzzy import fuzz
+from csv_utils import write_dict_rows, write_parquet_rows
+from json_utils import read_json
+from config import ORACLE_BULK_FETCH_SIZE
 
 # 로깅 설정
 logging.basicConfig(
@@ -14,10 +18,112 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 연도(20xx) 추출 패턴 - 파일명/예산 셀 파싱에서 반복 사용
+YEAR_PATTERN = re.compile(r'(20\d{2})')
+
+
+def load_existing_plan_data(db_manager) -> Dict[tuple, str]:
+    """
+    기존 PLAN_DATA를 DB에서 한 번에 로드 (매칭 캐시용)
+
+    Args:
+        db_manager: 연결된 OracleDBManager
+
+    Returns:
+        {(YEAR, BIZ_NM, DETAIL_BIZ_NM): PLAN_ID}
+    """
+    existing_plan_data = {}
+    logger.info("🔄 기존 PLAN_DATA 로드 중...")
+    try:
+        if not db_manager:
+            logger.warning("⚠️ DB 매니저가 없습니다. 매칭 불가능.")
+            return existing_plan_data
+
+        if not db_manager.connection:
+            logger.warning("⚠️ DB 연결이 없습니다. 매칭 불가능.")
+            return existing_plan_data
+
+        cursor = db_manager.connection.cursor()
+        # 전체 PLAN_DATA를 읽으므로 왕복당 가져오는 행 수를 늘림
+        cursor.arraysize = ORACLE_BULK_FETCH_SIZE
+        cursor.prefetchrows = ORACLE_BULK_FETCH_SIZE
+        query = """
+            SELECT PLAN_ID, YEAR, BIZ_NM, DETAIL_BIZ_NM
+            FROM TB_PLAN_DATA
+            WHERE DELETE_YN = 'N'
+        """
+        cursor.execute(query)
+
+        count = 0
+        for plan_id, year, biz_nm, detail_biz_nm in cursor:
+            count += 1
+            # ⭐ 원본 그대로 저장 (trim만 적용)
+            biz_nm_clean = biz_nm.strip() if biz_nm else ""
+            detail_biz_nm_clean = detail_biz_nm.strip() if detail_biz_nm else ""
+
+            key = (year, biz_nm_clean, detail_biz_nm_clean)
+            existing_plan_data[key] = plan_id.strip() if plan_id else None
+
+            # 디버깅: 각 연도별 처음 2개만 출력
+            if count <= 10:
+                logger.info(f"   DB 키: ({year}, '{biz_nm_clean[:30]}...', '{detail_biz_nm_clean[:30]}...') -> {plan_id}")
+
+        cursor.close()
+        logger.info(f"✅ 기존 PLAN_DATA 로드 완료: {len(existing_plan_data)}건")
+    except Exception as e:
+        logger.error(f"❌ 기존 PLAN_DATA 로드 실패: {e}", exc_info=True)
+
+    return existing_plan_data
+
+
+# 프로세스 풀 워커별 기존 PLAN_DATA 캐시 (initializer로 워커당 1회만 전달)
+_WORKER_EXISTING_PLAN_DATA: Dict[tuple, str] = {}
+
+
+def init_normalize_worker(existing_plan_data: Dict[tuple, str]):
+    """정규화 워커 초기화 - 기존 PLAN_DATA를 작업마다 다시 전송하지 않도록 저장"""
+    global _WORKER_EXISTING_PLAN_DATA
+    _WORKER_EXISTING_PLAN_DATA = existing_plan_data or {}
+
+
+def normalize_json_file(json_path: str, output_dir: str,
+                        existing_plan_data: Dict[tuple, str] = None) -> Dict[str, Any]:
+    """
+    JSON 1개 정규화 (프로세스 풀 워커용)
+
+    Args:
+        json_path: JSON 파일 경로
+        output_dir: CSV 출력 디렉토리
+        existing_plan_data: 기존 PLAN_DATA 캐시 (None이면 init_normalize_worker로 받은 값 사용)
+
+    Returns:
+        {'file', 'status', 'data', 'error'} - data는 normalizer.data (병합 전, 파일 단위 ID)
+    """
+    if existing_plan_data is None:
+        existing_plan_data = _WORKER_EXISTING_PLAN_DATA
+
+    try:
+        normalizer = GovernmentStandardNormalizer(
+            json_path, output_dir, existing_plan_data=existing_plan_data
+        )
+        json_data = read_json(json_path)
+
+        if not normalizer.normalize(json_data):
+            raise ValueError("정규화 실패")
+
+        return {'file': Path(json_path).name, 'status': 'success', 'data': normalizer.data}
+
+    except Exception as e:
+        logger.error(f"❌ 정규화 실패: {json_path} ({e})")
+        return {'file': Path(json_path).name, 'status': 'failed', 'data': None, 'error': str(e)}
+
 
 class GovernmentStandardNormalizer:
     """정부 표준 형식으로 정규화"""
 
+    # PLAN_ID로 TB_PLAN_DATA를 참조하는 하위 테이블
+    CHILD_TABLES = ('budgets', 'schedules', 'performances', 'achievements')
+
     SPECIAL_CHAR_PATTERN = re.compile(r'[(){}\[\]<>「」『』"\'`]|\s{2,}')
 
     @staticmethod
@@ -93,30 +199,21 @@ class GovernmentStandardNormalizer:
         norm_biz = self._normalize_for_matching(biz_name)
         norm_detail = self._normalize_for_matching(detail_biz_name)
 
-        # 1단계: 완전 일치 (원본 텍스트)
-        for (db_year, db_biz, db_detail), plan_id in self.existing_plan_data.items():
-            if db_year != year:
-                continue
-            if db_biz.strip() == biz_name and db_detail.strip() == detail_biz_name:
-                return (plan_id, 100, "완전일치")
+        # 1단계: 완전 일치 (원본 텍스트) - 키가 이미 trim 되어 있으므로 해시 조회
+        exact_key = (year, biz_name, detail_biz_name)
+        if exact_key in self.existing_plan_data:
+            return (self.existing_plan_data[exact_key], 100, "완전일치")
+
+        # 해당 연도 후보 (정규화 결과는 인덱스 생성 시 한 번만 계산)
+        candidates = self._plan_index_by_year.get(year, [])
 
         # 2단계: 정규화 후 완전 일치
-        for (db_year, db_biz, db_detail), plan_id in self.existing_plan_data.items():
-            if db_year != year:
-                continue
-            db_norm_biz = self._normalize_for_matching(db_biz)
-            db_norm_detail = self._normalize_for_matching(db_detail)
-            
+        for db_biz, db_detail, db_norm_biz, db_norm_detail, plan_id in candidates:
             if norm_biz == db_norm_biz and norm_detail == db_norm_detail:
                 return (plan_id, 99, "정규화일치")
 
         # 3단계: 교차 매칭 (BIZ ↔ DETAIL 서로 바뀐 경우)
-        for (db_year, db_biz, db_detail), plan_id in self.existing_plan_data.items():
-            if db_year != year:
-                continue
-            db_norm_biz = self._normalize_for_matching(db_biz)
-            db_norm_detail = self._normalize_for_matching(db_detail)
-            
+        for db_biz, db_detail, db_norm_biz, db_norm_detail, plan_id in candidates:
             # BIZ와 DETAIL이 서로 바뀐 경우
             if norm_biz == db_norm_detail and norm_detail == db_norm_biz:
                 return (plan_id, 98, "교차일치")
@@ -132,17 +229,12 @@ class GovernmentStandardNormalizer:
         best_plan_id = None
         best_reason = None
 
-        for (db_year, db_biz, db_detail), plan_id in self.existing_plan_data.items():
-            if db_year != year:
-                continue
-
+        for db_biz, db_detail, db_norm_biz, db_norm_detail, plan_id in candidates:
             # 유사도 계산
             biz_sim = fuzz.token_sort_ratio(biz_name, db_biz) if biz_name and db_biz else 0
             detail_sim = fuzz.token_sort_ratio(detail_biz_name, db_detail) if detail_biz_name and db_detail else 0
             
             # 정규화 버전으로도 비교
-            db_norm_biz = self._normalize_for_matching(db_biz)
-            db_norm_detail = self._normalize_for_matching(db_detail)
             norm_biz_sim = fuzz.ratio(norm_biz, db_norm_biz) if norm_biz and db_norm_biz else 0
             norm_detail_sim = fuzz.ratio(norm_detail, db_norm_detail) if norm_detail and db_norm_detail else 0
             
@@ -171,7 +263,8 @@ class GovernmentStandardNormalizer:
         return (None, 0, None)
 
 
-    def __init__(self, json_path: str, output_dir: str, db_manager=None):
+    def __init__(self, json_path: str, output_dir: str, db_manager=None,
+                 existing_plan_data: Dict = None):
         self.json_path = Path(json_path)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
@@ -181,8 +274,7 @@ class GovernmentStandardNormalizer:
         document_year = 0000  # 기본값
         filename = self.json_path.stem  # 확장자 제외한 파일명
 
-        import re
-        year_match = re.search(r'(20\d{2})', filename)
+        year_match = YEAR_PATTERN.search(filename)
         if year_match:
             document_year = int(year_match.group(1))
 
@@ -236,48 +328,30 @@ class GovernmentStandardNormalizer:
         }
 
         # 기존 PLAN_DATA 캐시 (YEAR, BIZ_NM, DETAIL_BIZ_NM) -> PLAN_ID
-        self.existing_plan_data = {}
-        if db_manager:
-            self._load_existing_plan_data()
-
-    def _load_existing_plan_data(self):
-        """기존 PLAN_DATA를 DB에서 로드 (캐시용)"""
-        logger.info("🔄 기존 PLAN_DATA 로드 중...")
-        try:
-            if not self.db_manager:
-                logger.warning("⚠️ DB 매니저가 없습니다. 매칭 불가능.")
-                return
-
-            if not self.db_manager.connection:
-                logger.warning("⚠️ DB 연결이 없습니다. 매칭 불가능.")
-                return
-
-            cursor = self.db_manager.connection.cursor()
-            query = """
-                SELECT PLAN_ID, YEAR, BIZ_NM, DETAIL_BIZ_NM
-                FROM TB_PLAN_DATA
-                WHERE DELETE_YN = 'N'
-            """
-            cursor.execute(query)
-
-            count = 0
-            for plan_id, year, biz_nm, detail_biz_nm in cursor:
-                count += 1
-                # ⭐ 원본 그대로 저장 (trim만 적용)
-                biz_nm_clean = biz_nm.strip() if biz_nm else ""
-                detail_biz_nm_clean = detail_biz_nm.strip() if detail_biz_nm else ""
-
-                key = (year, biz_nm_clean, detail_biz_nm_clean)
-                self.existing_plan_data[key] = plan_id.strip() if plan_id else None
-
-                # 디버깅: 각 연도별 처음 2개만 출력
-                if count <= 10:
-                    logger.info(f"   DB 키: ({year}, '{biz_nm_clean[:30]}...', '{detail_biz_nm_clean[:30]}...') -> {plan_id}")
-
-            cursor.close()
-            logger.info(f"✅ 기존 PLAN_DATA 로드 완료: {len(self.existing_plan_data)}건")
-        except Exception as e:
-            logger.error(f"❌ 기존 PLAN_DATA 로드 실패: {e}", exc_info=True)
+        # 미리 조회한 캐시가 주어지면 DB 조회 없이 그대로 사용 (여러 파일 공유용)
+        if existing_plan_data is not None:
+            self.existing_plan_data = existing_plan_data
+        elif db_manager:
+            self.existing_plan_data = load_existing_plan_data(db_manager)
+        else:
+            self.existing_plan_data = {}
+
+        # 연도별 매칭 후보 인덱스 {year: [(BIZ_NM, DETAIL_BIZ_NM, 정규화 BIZ, 정규화 DETAIL, PLAN_ID)]}
+        self._plan_index_by_year = self._build_plan_index(self.existing_plan_data)
+
+    @classmethod
+    def _build_plan_index(cls, existing_plan_data: Dict) -> Dict[Any, List[tuple]]:
+        """매칭용 연도별 인덱스 생성 (DB 키 정규화를 행마다 반복하지 않도록 1회 계산)"""
+        index = {}
+        for (db_year, db_biz, db_detail), plan_id in existing_plan_data.items():
+            index.setdefault(db_year, []).append((
+                db_biz,
+                db_detail,
+                cls._normalize_for_matching(db_biz),
+                cls._normalize_for_matching(db_detail),
+                plan_id
+            ))
+        return index
 
     def _get_next_id(self, entity_type: str) -> int:
         """ID 생성"""
@@ -346,6 +420,15 @@ class GovernmentStandardNormalizer:
         """
         logger.info("� TB_PLAN_DATA 집계 필드 계산 중...")
 
+        # PLAN_ID별 하위 레코드를 한 번만 묶어둠 (내역사업마다 전체 목록을 다시 훑지 않도록)
+        budgets_by_plan = {}
+        for budget in self.data['budgets']:
+            budgets_by_plan.setdefault(budget['PLAN_ID'], []).append(budget)
+
+        schedules_by_plan = {}
+        for schedule in self.data['schedules']:
+            schedules_by_plan.setdefault(schedule['PLAN_ID'], []).append(schedule)
+
         for plan_data in self.data['plan_data']:
             plan_id = plan_data['PLAN_ID']
             doc_year = plan_data['YEAR']
@@ -353,7 +436,7 @@ class GovernmentStandardNormalizer:
             # ============================================================
             # 1. 예산 데이터로부터 집계 (TB_PLAN_BUDGET)
             # ============================================================
-            plan_budgets = [b for b in self.data['budgets'] if b['PLAN_ID'] == plan_id]
+            plan_budgets = budgets_by_plan.get(plan_id, [])
 
             if plan_budgets:
                 # 총 연구비 집계 (모든 연도 합산)
@@ -403,7 +486,7 @@ class GovernmentStandardNormalizer:
             # ============================================================
             # 2. 일정 데이터로부터 사업 시작일/종료일 (TB_PLAN_SCHEDULE)
             # ============================================================
-            plan_schedules = [s for s in self.data['schedules'] if s['PLAN_ID'] == plan_id]
+            plan_schedules = schedules_by_plan.get(plan_id, [])
 
             if plan_schedules:
                 # START_DATE가 있는 레코드에서 최소값
@@ -800,7 +883,7 @@ class GovernmentStandardNormalizer:
 
             for line in lines:
                 line = line.strip()
-                year_match = re.search(r'(20\d{2})', line)
+                year_match = YEAR_PATTERN.search(line)
                 if year_match:
                     year = int(year_match.group(1))
                 if '실적' in line:
@@ -1247,6 +1330,18 @@ class GovernmentStandardNormalizer:
         return True
 
 
+    def _tag_child_rows(self, page_start: Dict[str, int]):
+        """
+        페이지에서 추가된 하위 레코드에 소속 내역사업의 _internal_id 기록
+
+        PLAN_ID는 매칭 결과에 따라 여러 내역사업이 같은 값을 가질 수 있으므로
+        merge에서 하위 레코드를 내역사업 단위로 옮길 때 사용 (CSV/DB 적재 시에는 무시됨)
+        """
+        sub_id = self.current_context['sub_project_id']
+        for table, start in page_start.items():
+            for row in self.data[table][start:]:
+                row['_internal_id'] = sub_id
+
     def normalize(self, json_data: Dict) -> bool:
         """JSON 데이터 정규화 (전체 처리)"""
         try:
@@ -1305,6 +1400,9 @@ class GovernmentStandardNormalizer:
                     logger.debug(f" 페이지 {page_num}: sub_project_id 없음, 건너뜀")
                     continue
 
+                # 이 페이지에서 추가되는 하위 레코드 시작 위치 (소속 내역사업 표시용)
+                page_start = {table: len(self.data[table]) for table in self.CHILD_TABLES}
+
                 # 원본 데이터 저장
                 raw_data_id = self._save_raw_data(
                     page_category or 'unknown',
@@ -1394,6 +1492,8 @@ class GovernmentStandardNormalizer:
 
                         self.validation_stats['processed_tables'] += 1
 
+                self._tag_child_rows(page_start)
+
             #  최종 단계: "미분류" NATION_ORGAN_NM 재검색
             logger.info(" 미분류 부처명 재검색 중...")
             for plan_data in self.data['plan_data']:
@@ -1422,6 +1522,66 @@ class GovernmentStandardNormalizer:
             traceback.print_exc()
             return False
 
+    def merge(self, other_data: Dict[str, List[Dict]]):
+        """
+        다른 normalizer의 결과(data)를 현재 결과 뒤에 병합 (파일별 병렬 정규화 결과 합치기용)
+
+        - BIZ_NM + DETAIL_BIZ_NM이 같은 내역사업은 앞 파일의 레코드를 재사용
+        - _internal_id/NUM, TEMP PLAN_ID, raw_data id는 현재 카운터 기준으로 다시 부여
+        - 하위 레코드는 소속 내역사업(_internal_id) 기준으로 PLAN_ID를 치환
+
+        파일마다 빈 상태에서 정규화하므로 여러 파일을 한 normalizer로 순차 normalize()한
+        결과와는 다음이 다름 (main.py와 Streamlit 앱은 모두 이 병합 경로를 사용):
+        - 페이지 sub_project가 앞 파일 내역사업의 BIZ_NM과 같아도 그 내역사업으로 전환하지 않음
+          → 해당 페이지에서 내역사업을 새로 만들거나(이후 이름이 같으면 위 규칙으로 재사용),
+            세부사업명이 없으면 파일 안의 현재 내역사업에 붙이거나 건너뜀
+        - 파일 첫 내역사업 이전 페이지는 앞 파일의 마지막 내역사업에 붙지 않고 건너뜀
+        """
+        plan_by_name = {}
+        for plan_data in self.data['plan_data']:
+            plan_by_name.setdefault((plan_data.get('BIZ_NM'), plan_data.get('DETAIL_BIZ_NM')), plan_data)
+
+        # 병합할 결과의 _internal_id → 병합 후 내역사업 레코드
+        record_remap = {}
+        for record in other_data['plan_data']:
+            name_key = (record.get('BIZ_NM'), record.get('DETAIL_BIZ_NM'))
+            existing = plan_by_name.get(name_key)
+            if existing:
+                record_remap[record['_internal_id']] = existing
+                continue
+
+            sub_id = self._get_next_id('sub_project')
+            plan_id = record['PLAN_ID']
+            if str(plan_id).startswith('TEMP_'):
+                plan_id = f"TEMP_{record['YEAR']}_{str(sub_id).zfill(4)}"
+            record_remap[record['_internal_id']] = record
+
+            record['_internal_id'] = sub_id
+            record['NUM'] = sub_id
+            record['PLAN_ID'] = plan_id
+            self.plan_id_mapping[sub_id] = plan_id
+            self.data['plan_data'].append(record)
+            plan_by_name[name_key] = record
+
+        # 하위 레코드는 PLAN_ID가 아니라 소속 내역사업(_internal_id) 기준으로 옮김
+        # (유사도 매칭으로 서로 다른 내역사업이 같은 PLAN_ID를 받을 수 있음)
+        for table in self.CHILD_TABLES:
+            rows = other_data[table]
+            for row in rows:
+                target = record_remap.get(row.get('_internal_id'))
+                if target is not None:
+                    row['_internal_id'] = target['_internal_id']
+                    row['PLAN_ID'] = target['PLAN_ID']
+            self.data[table].extend(rows)
+
+        # raw_data id는 연속 구간으로 한 번에 재부여
+        raw_rows = other_data['raw_data']
+        first_raw_id = self.id_counters['raw_data']
+        for offset, raw in enumerate(raw_rows):
+            raw['id'] = first_raw_id + offset
+        self.id_counters['raw_data'] += len(raw_rows)
+        self.data['raw_data'].extend(raw_rows)
+
     def save_to_csv(self):
         """CSV 저장 - TB_PLAN_DATA 기반 스키마"""
 
@@ -1448,106 +1608,94 @@ class GovernmentStandardNormalizer:
         self._aggregate_plan_data_fields()
 
 
+        # 테이블별 (파일명, 레코드, 컬럼 순서, Parquet 저장 여부)
+        tasks = []
+
         # TB_PLAN_DATA (회사 기존 43개 컬럼, _internal_id 제외)
         if self.data['plan_data']:
-            csv_path = self.output_dir / "TB_PLAN_DATA.csv"
-            with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
-                # _internal_id 제외한 전체 컬럼
-                fieldnames = [k for k in self.data['plan_data'][0].keys()
-                            if k != '_internal_id']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for record in self.data['plan_data']:
-                    row = {k: v for k, v in record.items()
-                          if k != '_internal_id'}
-                    writer.writerow(row)
-            logger.info(f" TB_PLAN_DATA.csv 저장 ({len(self.data['plan_data'])}건)")
+            fieldnames = [k for k in self.data['plan_data'][0].keys()
+                          if k != '_internal_id']
+            tasks.append(("TB_PLAN_DATA", self.data['plan_data'], fieldnames, True))
 
         # TB_PLAN_BUDGET
         if self.data['budgets']:
-            csv_path = self.output_dir / "TB_PLAN_BUDGET.csv"
-            with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
-                #  PLAN_ID를 첫 번째 컬럼으로
-                fieldnames = ['PLAN_ID', 'BUDGET_YEAR', 'CATEGORY', 'TOTAL_AMOUNT',
-                             'GOV_AMOUNT', 'PRIVATE_AMOUNT', 'LOCAL_AMOUNT', 'ETC_AMOUNT',
-                             'PERFORM_PRC', 'PLAN_PRC']
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                writer.writeheader()
-                writer.writerows(self.data['budgets'])
-            logger.info(f" TB_PLAN_BUDGET.csv 저장 ({len(self.data['budgets'])}건)")
+            #  PLAN_ID를 첫 번째 컬럼으로
+            fieldnames = ['PLAN_ID', 'BUDGET_YEAR', 'CATEGORY', 'TOTAL_AMOUNT',
+                         'GOV_AMOUNT', 'PRIVATE_AMOUNT', 'LOCAL_AMOUNT', 'ETC_AMOUNT',
+                         'PERFORM_PRC', 'PLAN_PRC']
+            tasks.append(("TB_PLAN_BUDGET", self.data['budgets'], fieldnames, True))
 
         # TB_PLAN_SCHEDULE
         if self.data['schedules']:
-            csv_path = self.output_dir / "TB_PLAN_SCHEDULE.csv"
-            with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
-                #  PLAN_ID를 첫 번째 컬럼으로
-                fieldnames = ['PLAN_ID', 'SCHEDULE_YEAR', 'QUARTER', 'TASK_NAME',
-                             'TASK_CONTENT', 'START_DATE', 'END_DATE']
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                writer.writeheader()
-                writer.writerows(self.data['schedules'])
-            logger.info(f" TB_PLAN_SCHEDULE.csv 저장 ({len(self.data['schedules'])}건)")
+            #  PLAN_ID를 첫 번째 컬럼으로
+            fieldnames = ['PLAN_ID', 'SCHEDULE_YEAR', 'QUARTER', 'TASK_NAME',
+                         'TASK_CONTENT', 'START_DATE', 'END_DATE']
+            tasks.append(("TB_PLAN_SCHEDULE", self.data['schedules'], fieldnames, True))
 
         # TB_PLAN_PERFORMANCE
         if self.data['performances']:
-            csv_path = self.output_dir / "TB_PLAN_PERFORMANCE.csv"
-            with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
-                #  PLAN_ID를 첫 번째 컬럼으로
-                fieldnames = ['PLAN_ID', 'PERFORMANCE_YEAR', 'PERFORMANCE_TYPE', 'CATEGORY',
-                             'INDICATOR_NAME', 'TARGET_VALUE', 'ACTUAL_VALUE', 'UNIT',
-                             'ORIGINAL_TEXT', 'VALUE']
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                writer.writeheader()
-                writer.writerows(self.data['performances'])
-            logger.info(f" TB_PLAN_PERFORMANCE.csv 저장 ({len(self.data['performances'])}건)")
+            #  PLAN_ID를 첫 번째 컬럼으로
+            fieldnames = ['PLAN_ID', 'PERFORMANCE_YEAR', 'PERFORMANCE_TYPE', 'CATEGORY',
+                         'INDICATOR_NAME', 'TARGET_VALUE', 'ACTUAL_VALUE', 'UNIT',
+                         'ORIGINAL_TEXT', 'VALUE']
+            tasks.append(("TB_PLAN_PERFORMANCE", self.data['performances'], fieldnames, True))
 
         # TB_PLAN_ACHIEVEMENTS
         if self.data['achievements']:
-            csv_path = self.output_dir / "TB_PLAN_ACHIEVEMENTS.csv"
-            with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
-                #  PLAN_ID를 첫 번째 컬럼으로 명시적 순서 지정
-                fieldnames = ['PLAN_ID', 'ACHIEVEMENT_YEAR', 'ACHIEVEMENT_TYPE',
-                             'TITLE', 'DESCRIPTION', 'PAGE_NUMBER']
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                writer.writeheader()
-                writer.writerows(self.data['achievements'])
-            logger.info(f" TB_PLAN_ACHIEVEMENTS.csv 저장 ({len(self.data['achievements'])}건)")
+            #  PLAN_ID를 첫 번째 컬럼으로 명시적 순서 지정
+            fieldnames = ['PLAN_ID', 'ACHIEVEMENT_YEAR', 'ACHIEVEMENT_TYPE',
+                         'TITLE', 'DESCRIPTION', 'PAGE_NUMBER']
+            tasks.append(("TB_PLAN_ACHIEVEMENTS", self.data['achievements'], fieldnames, True))
 
         # 원본 데이터 (감사용)
         if self.data['raw_data']:
-            csv_path = self.output_dir / "raw_data.csv"
-            with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=self.data['raw_data'][0].keys())
-                writer.writeheader()
-                writer.writerows(self.data['raw_data'])
-            logger.info(f" raw_data.csv 저장 ({len(self.data['raw_data'])}건)")
+            tasks.append(("raw_data", self.data['raw_data'], list(self.data['raw_data'][0].keys()), False))
+
+        if not tasks:
+            return
+
+        # 테이블별 파일 쓰기는 서로 독립적이므로 스레드로 동시에 수행
+        # (Arrow writer는 GIL을 풀고 쓰기 때문에 실제로 겹쳐 실행됨)
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            written = list(executor.map(self._write_table, tasks))
+
+        for name, count in written:
+            logger.info(f" {name}.csv 저장 ({count}건)")
+
+    def _write_table(self, task: tuple) -> tuple:
+        """테이블 1개 CSV(+Parquet) 저장 - save_to_csv 스레드 작업용"""
+        name, rows, fieldnames, with_parquet = task
+        write_dict_rows(self.output_dir / f"{name}.csv", rows, fieldnames)
+        if with_parquet:
+            write_parquet_rows(self.output_dir / f"{name}.parquet", rows, fieldnames)
+        return name, len(rows)
 
     def print_statistics(self):
-        """통계 출력"""
-        print("\n" + "="*80)
-        print("� 정부 표준 정규화 완료 (TB_PLAN_DATA + 하위 테이블)")
-        print("="*80)
+        """통계 출력 (줄 단위로 모아 한 번에 기록)"""
+        lines = []
+        lines.append("\n" + "="*80)
+        lines.append("� 정부 표준 정규화 완료 (TB_PLAN_DATA + 하위 테이블)")
+        lines.append("="*80)
 
-        print(f"\n� 내역사업 (TB_PLAN_DATA): {len(self.data['plan_data'])}개")
+        lines.append(f"\n� 내역사업 (TB_PLAN_DATA): {len(self.data['plan_data'])}개")
         for plan_data in self.data['plan_data'][:10]:  # 처음 10개만 표시
-            print(f"  - {plan_data['BIZ_NM']} (PLAN_ID: {plan_data['PLAN_ID']})")
+            lines.append(f"  - {plan_data['BIZ_NM']} (PLAN_ID: {plan_data['PLAN_ID']})")
         if len(self.data['plan_data']) > 10:
-            print(f"  ... 외 {len(self.data['plan_data']) - 10}개")
+            lines.append(f"  ... 외 {len(self.data['plan_data']) - 10}개")
 
-        print(f"\n� Oracle 테이블별 데이터 통계:")
-        print(f"  TB_PLAN_DATA:        {len(self.data['plan_data'])}건")
-        print(f"  TB_PLAN_BUDGET:      {len(self.data['budgets'])}건")
-        print(f"  TB_PLAN_SCHEDULE:    {len(self.data['schedules'])}건")
-        print(f"  TB_PLAN_PERFORMANCE: {len(self.data['performances'])}건")
-        print(f"  TB_PLAN_ACHIEVEMENTS: {len(self.data['achievements'])}건")
-        print(f"  raw_data (감사용):    {len(self.data['raw_data'])}건")
+        lines.append(f"\n� Oracle 테이블별 데이터 통계:")
+        lines.append(f"  TB_PLAN_DATA:        {len(self.data['plan_data'])}건")
+        lines.append(f"  TB_PLAN_BUDGET:      {len(self.data['budgets'])}건")
+        lines.append(f"  TB_PLAN_SCHEDULE:    {len(self.data['schedules'])}건")
+        lines.append(f"  TB_PLAN_PERFORMANCE: {len(self.data['performances'])}건")
+        lines.append(f"  TB_PLAN_ACHIEVEMENTS: {len(self.data['achievements'])}건")
+        lines.append(f"  raw_data (감사용):    {len(self.data['raw_data'])}건")
 
-        print("="*80 + "\n")
+        lines.append("="*80 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) < 2:
         print("사용법: python normalize_government_standard.py <JSON파일경로> [출력디렉토리]")
         print("예제: python normalize_government_standard.py output/2024년도_생명공학육성시행계획.json normalized_output_government")
@@ -1562,8 +1710,7 @@ if __name__ == "__main__":
 
     normalizer = GovernmentStandardNormalizer(json_file, output_folder)
 
-    with open(json_file, 'r', encoding='utf-8') as f:
-        json_data = json.load(f)
+    json_data = read_json(json_file)
 
     success = normalizer.normalize(json_data)
 
@@ -3,10 +3,46 @@ Oracle 데이터베이스 연결 및 관리 모듈
 """
 import oracledb
 import logging
+import threading
 from typing import Dict, List, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# 조회 1회 왕복당 가져올 행 수 (기본값 100 → 대량 조회 시 왕복 횟수 감소)
+FETCH_ARRAYSIZE = 5000
+
+# 접속 설정별 커넥션 풀 (프로세스 내 공유 - 재연결 시 로그인 핸드셰이크 생략)
+POOL_MIN = 1
+POOL_MAX = 4
+POOL_WAIT_TIMEOUT_MS = 30000  # 풀이 가득 찼을 때 대기 상한 (반환되지 않은 연결로 무한 대기 방지)
+_pools: Dict[tuple, "oracledb.ConnectionPool"] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(db_config: Dict[str, Any]) -> "oracledb.ConnectionPool":
+    """접속 설정에 해당하는 커넥션 풀 반환 (없으면 생성, thin 모드)"""
+    key = (db_config['host'], db_config['port'], db_config.get('sid'), db_config['user'])
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            dsn = oracledb.makedsn(
+                db_config['host'],
+                db_config['port'],
+                sid=db_config.get('sid')
+            )
+            pool = oracledb.create_pool(
+                user=db_config['user'],
+                password=db_config['password'],
+                dsn=dsn,
+                min=POOL_MIN,
+                max=POOL_MAX,
+                increment=1,
+                getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+                wait_timeout=POOL_WAIT_TIMEOUT_MS
+            )
+            _pools[key] = pool
+        return pool
+
 
 class OracleDBManager:
     """Oracle 데이터베이스 관리 클래스"""
@@ -21,23 +57,14 @@ class OracleDBManager:
         self.cursor = None
 
     def connect(self):
-        """Oracle 데이터베이스 연결"""
+        """Oracle 데이터베이스 연결 (접속 설정별 커넥션 풀 사용)"""
         try:
-            # DSN 생성
-            dsn = oracledb.makedsn(
-                self.db_config['host'],
-                self.db_config['port'],
-                sid=self.db_config.get('sid')
-            )
-
-            # 연결
-            self.connection = oracledb.connect(
-                user=self.db_config['user'],
-                password=self.db_config['password'],
-                dsn=dsn
-            )
+            # 풀에서 연결 획득 (close 시 풀로 반환)
+            self.connection = _get_pool(self.db_config).acquire()
 
             self.cursor = self.connection.cursor()
+            self.cursor.arraysize = FETCH_ARRAYSIZE
+            self.cursor.prefetchrows = FETCH_ARRAYSIZE + 1
             logger.info("✅ Oracle 데이터베이스 연결 성공")
 
             return True
@@ -78,6 +105,20 @@ class OracleDBManager:
             logger.error(f"❌ 쿼리 실행 실패: {error}")
             raise
 
+    def fetchval(self, query: str, params: Optional[Dict or tuple] = None) -> Any:
+        """
+        단일 값 조회 (COUNT/MAX 등 스칼라 쿼리용)
+
+        Args:
+            query: SQL 쿼리문
+            params: 파라미터 (dict 또는 tuple)
+
+        Returns:
+            첫 행의 첫 컬럼 값, 결과가 없으면 None
+        """
+        row = self.execute_query(query, params).fetchone()
+        return row[0] if row else None
+
     def execute_many(self, query: str, data: List[tuple]):
         """배치 INSERT"""
         try:
@@ -100,23 +141,21 @@ class OracleDBManager:
             self.connection.rollback()
 
     def close(self):
-        """연결 종료"""
+        """연결 종료 (풀 연결은 풀로 반환)"""
         try:
             if self.cursor:
                 self.cursor.close()
+        except Exception as e:
+            logger.warning(f"커서 종료 중 오류: {e}")
+        try:
             if self.connection:
                 self.connection.close()
                 logger.info("🔌 Oracle 연결 종료")
         except Exception as e:
             logger.warning(f"연결 종료 중 오류: {e}")
-
-    def close(self):
-        """연결 종료"""
-        if self.cursor:
-            self.cursor.close()
-        if self.connection:
-            self.connection.close()
-        logger.info("🔌 Oracle 연결 종료")
+        finally:
+            self.cursor = None
+            self.connection = None
 
     def table_exists(self, table_name: str) -> bool:
         """테이블 존재 여부 확인"""
@@ -125,8 +164,7 @@ class OracleDBManager:
             FROM USER_TABLES 
             WHERE TABLE_NAME = UPPER(:table_name)
         """
-        result = self.execute_query(query, (table_name,))
-        return result[0][0] > 0
+        return (self.fetchval(query, (table_name,)) or 0) > 0
 
     def drop_table(self, table_name: str, cascade: bool = True):
         """테이블 삭제"""
@@ -148,8 +186,7 @@ class OracleDBManager:
             FROM TB_PLAN_DATA 
             WHERE SUBSTR(PLAN_ID, 1, 4) = :year
         """
-        result = self.execute_query(query, (str(year),))
-        max_num = result[0][0]
+        max_num = self.fetchval(query, (str(year),))
 
         if max_num is None:
             next_num = 1
@@ -162,6 +199,5 @@ class OracleDBManager:
     def plan_id_exists(self, plan_id: str) -> bool:
         """PLAN_ID 존재 여부 확인"""
         query = "SELECT COUNT(*) FROM TB_PLAN_DATA WHERE PLAN_ID = :plan_id"
-        result = self.execute_query(query, (plan_id,))
-        return result[0][0] > 0
+        return (self.fetchval(query, (plan_id,)) or 0) > 0
 
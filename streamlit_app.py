@@ -10,29 +10,69 @@ Streamlit 웹 UI
 import streamlit as st
 import pandas as pd
 from pathlib import Path
-import json
+import csv
 import time
 import sys
 import os
-import re
+import shutil
+import tempfile
+import functools
+import hashlib
+import traceback
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import importlib.util
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
 
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# 모듈 임포트
-from extract_pdf_to_json import extract_pdf_to_json
-from normalize_government_standard import GovernmentStandardNormalizer
+# 모듈 임포트 (PDF 추출/DB 모듈은 첫 사용 시점에 지연 임포트)
+from normalize_government_standard import (
+    GovernmentStandardNormalizer, load_existing_plan_data,
+    init_normalize_worker, normalize_json_file
+)
+from csv_utils import read_csv_arrow
 from config import INPUT_DIR, OUTPUT_DIR, NORMALIZED_OUTPUT_GOVERNMENT_DIR
 
-# DB 모듈 (선택적)
-try:
+
+@functools.lru_cache(maxsize=None)
+def _get_extractor():
+    """PDF 추출 워커 지연 로드 (pdfplumber 임포트를 첫 PDF 처리 시점으로 미룸)"""
+    from extract_pdf_to_json import extract_pdf_worker
+    return extract_pdf_worker
+
+
+@functools.lru_cache(maxsize=None)
+def _get_oracle():
+    """DB 모듈 지연 로드 (oracledb 임포트를 첫 DB 작업 시점으로 미룸)"""
     from load_oracle_direct import OracleDirectLoader
     from oracle_db_manager import OracleDBManager
+    return OracleDirectLoader, OracleDBManager
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_db_available() -> bool:
+    """DB 모듈 사용 가능 여부 확인 (oracledb는 임포트하지 않고 설치 여부만 확인)"""
+    if importlib.util.find_spec('oracledb') is None:
+        print("⚠️ DB 모듈 로드 실패: oracledb 미설치")
+        return False
+    try:
+        from config import ORACLE_CONFIG, ORACLE_CONFIG_DEV  # noqa: F401
+    except ImportError as e:
+        print(f"⚠️ DB 모듈 로드 실패: {e}")
+        return False
+    return True
+
+
+# DB 설정 (선택적)
+DB_AVAILABLE = _probe_db_available()
+if DB_AVAILABLE:
     from config import ORACLE_CONFIG, ORACLE_CONFIG_DEV
-    DB_AVAILABLE = True
-except ImportError as e:
-    DB_AVAILABLE = False
-    print(f"⚠️ DB 모듈 로드 실패: {e}")
 
 # 페이지 설정
 st.set_page_config(
@@ -46,10 +86,15 @@ SERVER_INPUT_DIR = Path(INPUT_DIR).resolve()
 SERVER_OUTPUT_DIR = Path(OUTPUT_DIR).resolve()
 SERVER_NORMALIZED_DIR = Path(NORMALIZED_OUTPUT_GOVERNMENT_DIR).resolve()
 
+
+def _ensure_dirs():
+    """서버 디렉토리 생성 (재실행마다 확인 - 실행 중 삭제된 디렉토리도 다시 생성)"""
+    for d in (SERVER_INPUT_DIR, SERVER_OUTPUT_DIR, SERVER_NORMALIZED_DIR):
+        d.mkdir(parents=True, exist_ok=True)
+
+
 # 디렉토리 생성
-SERVER_INPUT_DIR.mkdir(exist_ok=True)
-SERVER_OUTPUT_DIR.mkdir(exist_ok=True)
-SERVER_NORMALIZED_DIR.mkdir(exist_ok=True)
+_ensure_dirs()
 
 # 세션 상태 초기화
 if 'processing_results' not in st.session_state:
@@ -60,136 +105,338 @@ if 'db_stats' not in st.session_state:
     st.session_state.db_stats = None
 
 
-def save_uploaded_files(uploaded_files):
-    """업로드된 파일 저장"""
-    saved_files = []
-    for file in uploaded_files:
-        file_path = SERVER_INPUT_DIR / file.name
-        with open(file_path, 'wb') as f:
-            f.write(file.getbuffer())
-        saved_files.append(file_path)
-    return saved_files
+# 업로드 파일 저장 시 복사 단위 (1MB)
+UPLOAD_COPY_CHUNK = 1024 * 1024
 
+# PDF 파싱 프로세스 수 상한 (6개 이상부터 효과가 거의 없음)
+PDF_MAX_WORKERS = 4
 
-def process_single_pdf(pdf_path, progress_callback=None):
-    """단일 PDF 처리 (PDF → JSON)"""
-    try:
-        if progress_callback:
-            progress_callback(f"📄 {pdf_path.name} - PDF 파싱 중...")
+# 진행률/상태 UI 갱신 최소 간격 (초) - 매 호출마다 웹소켓 전송하지 않도록 제한
+PROGRESS_UPDATE_INTERVAL = 0.25
 
-        if not pdf_path.exists():
-            raise FileNotFoundError(f"PDF 파일이 없습니다: {pdf_path}")
+# 정규화 결과 캐시 최대 항목 수 (JSON 파일 단위)
+NORMALIZE_CACHE_MAX_ENTRIES = 512
 
-        file_size = pdf_path.stat().st_size
-        if file_size == 0:
-            raise ValueError(f"PDF 파일이 비어있습니다: {pdf_path}")
+# 매칭 실패 레코드 표시 컬럼/최대 행 수
+UNMATCHED_DISPLAY_COLUMNS = ['year', 'biz_nm', 'detail_biz_nm', 'plan_id', 'reason']
+UNMATCHED_DISPLAY_ROWS = 500
+UNMATCHED_CATEGORY_COLUMNS = ['biz_nm', 'detail_biz_nm', 'reason']
 
-        # PDF → JSON 변환
-        extract_pdf_to_json(str(pdf_path), str(SERVER_OUTPUT_DIR))
 
-        # JSON 파일 확인
-        json_path = SERVER_OUTPUT_DIR / f"{pdf_path.stem}.json"
-        if not json_path.exists():
-            raise FileNotFoundError(f"JSON 파일이 생성되지 않았습니다: {json_path}")
+def _throttle(func, interval=PROGRESS_UPDATE_INTERVAL):
+    """
+    UI 갱신 콜백을 interval 간격으로 제한
 
-        with open(json_path, 'r', encoding='utf-8') as f:
-            json_data = json.load(f)
+    간격 내 호출은 마지막 인자만 보관했다가 다음 호출 또는 flush()에서 반영
+    (단계 마지막 상태가 사라지지 않도록 단계 종료 시 flush() 호출)
+    """
+    last_call = [0.0]
+    pending = []
 
-        pages_count = len(json_data.get('pages', []))
-        
-        return {
-            'file': pdf_path.name, 
-            'status': 'success', 
-            'json_path': str(json_path), 
-            'pages': pages_count
-        }
+    def wrapper(*args, **kwargs):
+        now = time.monotonic()
+        if now - last_call[0] >= interval:
+            last_call[0] = now
+            pending.clear()
+            func(*args, **kwargs)
+        else:
+            pending[:] = [(args, kwargs)]
 
-    except Exception as e:
-        import traceback
-        return {
-            'file': pdf_path.name, 
-            'status': 'failed', 
-            'error': str(e),
-            'traceback': traceback.format_exc()
+    def flush():
+        if pending:
+            args, kwargs = pending.pop()
+            last_call[0] = time.monotonic()
+            func(*args, **kwargs)
+
+    wrapper.flush = flush
+    return wrapper
+
+
+def _flush_progress(progress_callback):
+    """_throttle로 감싼 콜백이면 보류 중인 마지막 상태를 즉시 반영"""
+    flush = getattr(progress_callback, 'flush', None)
+    if flush is not None:
+        flush()
+
+
+def _show_traceback(exc: BaseException):
+    """예외 상세(traceback)를 접힌 expander에 표시 - 화면에는 오류 메시지만 노출"""
+    with st.expander("🔍 상세 오류", expanded=False):
+        st.code(''.join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
+
+
+def _save_one(file):
+    """업로드 파일 1개 저장 (UPLOAD_COPY_CHUNK 단위 스트리밍 복사)"""
+    file_path = SERVER_INPUT_DIR / file.name
+    tmp_path = None
+    try:
+        # 같은 이름 파일이 동시에 업로드되어도 겹치지 않도록 고유한 임시 파일에 기록
+        with tempfile.NamedTemporaryFile(
+            dir=SERVER_INPUT_DIR, prefix=f".{file_path.name}.", suffix='.part', delete=False
+        ) as out:
+            tmp_path = Path(out.name)
+            # 이전 rerun에서 읽은 위치가 남아 있을 수 있으므로 처음부터 복사
+            file.seek(0)
+            shutil.copyfileobj(file, out, UPLOAD_COPY_CHUNK)
+        # 임시 파일에 다 쓴 뒤 교체 (중단 시 잘린 PDF가 남지 않도록)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # 실패 시 임시 파일 정리 후 그대로 전파
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        raise
+    return file_path
+
+
+@dataclass(slots=True)
+class PdfResult:
+    """PDF 1개 처리 결과 (session_state.processing_results 항목)"""
+    file: str
+    status: str
+    json_path: Optional[str] = None
+    pages: int = 0
+    error: Optional[str] = None
+    traceback: Optional[str] = None
+
+
+def process_pdfs_parallel(uploaded_files, on_result=None):
+    """
+    업로드 파일 저장 + PDF → JSON 병렬 처리
+
+    저장(스레드)이 끝난 파일부터 바로 추출(프로세스 풀)에 제출하여
+    나머지 파일의 디스크 쓰기가 앞 파일의 파싱과 겹쳐 수행되도록 함.
+    Streamlit 호출은 모두 메인 스레드에서만 하고, 워커는 결과 딕셔너리만 반환
+
+    Args:
+        uploaded_files: st.file_uploader 업로드 파일 리스트
+        on_result: 완료될 때마다 호출되는 콜백 (완료 개수, PdfResult)
+
+    Returns:
+        업로드 순서대로 정렬된 PdfResult 리스트
+    """
+    if not uploaded_files:
+        return []
+
+    extract_pdf_worker = _get_extractor()
+    max_workers = min(os.cpu_count() or 1, PDF_MAX_WORKERS, len(uploaded_files))
+    results = {}
+    done = 0
+
+    def report(idx, result):
+        nonlocal done
+        done += 1
+        results[idx] = result
+        if on_result:
+            on_result(done, result)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(uploaded_files))) as save_pool, \
+            ProcessPoolExecutor(max_workers=max_workers) as executor:
+        save_futures = {
+            save_pool.submit(_save_one, file): idx
+            for idx, file in enumerate(uploaded_files)
         }
 
+        futures = {}
+        for save_future in as_completed(save_futures):
+            idx = save_futures[save_future]
+            try:
+                pdf_file = save_future.result()
+            except Exception as e:
+                report(idx, PdfResult(
+                    file=uploaded_files[idx].name,
+                    status='failed',
+                    error=f"파일 저장 실패: {e}",
+                    traceback=traceback.format_exc()
+                ))
+                continue
+            future = executor.submit(extract_pdf_worker, str(pdf_file), str(SERVER_OUTPUT_DIR))
+            futures[future] = (idx, pdf_file)
+
+        for future in as_completed(futures):
+            idx, pdf_file = futures[future]
+            try:
+                result = PdfResult(**future.result())
+            except Exception as e:
+                # 워커 프로세스 비정상 종료 등 (워커 내부 예외는 결과로 반환됨)
+                result = PdfResult(
+                    file=pdf_file.name,
+                    status='failed',
+                    error=str(e),
+                    traceback=traceback.format_exc()
+                )
+            report(idx, result)
+
+    return [results[idx] for idx in range(len(uploaded_files))]
+
+
+def _plan_data_fingerprint(existing_plan_data: dict) -> str:
+    """기존 PLAN_DATA 캐시 식별값 (정규화 캐시 키용 - 서버 재시작 후에도 동일)"""
+    digest = hashlib.sha1()
+    for item in sorted(existing_plan_data.items(), key=repr):
+        digest.update(repr(item).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class _NormalizeCache:
+    """
+    JSON별 정규화 결과 캐시 (프로세스 메모리, 최근 사용 순 max_entries개 유지)
+
+    값은 pickle 바이트로 보관하여 꺼낼 때마다 새 객체를 돌려줌
+    (merge가 레코드를 직접 수정하므로 캐시 원본이 바뀌지 않도록)
+    조회/저장은 스크립트 스레드에서만 하고, 여러 세션이 동시에 접근할 수 있어 lock으로 보호
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple):
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is None:
+                return None
+            self._entries.move_to_end(key)
+        return pickle.loads(blob)
+
+    def put(self, key: tuple, data):
+        blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries[key] = blob
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_normalize_cache() -> _NormalizeCache:
+    """정규화 결과 캐시 (프로세스당 1개 - 세션 간 공유)"""
+    return _NormalizeCache(NORMALIZE_CACHE_MAX_ENTRIES)
+
+
+@functools.lru_cache(maxsize=1)
+def _normalizer_version() -> str:
+    """정규화 모듈 소스 해시 (캐시 키용 - 정규화 로직이 바뀌면 이전 결과를 쓰지 않도록)"""
+    source = Path(normalize_json_file.__code__.co_filename).read_bytes()
+    return hashlib.sha1(source).hexdigest()
+
 
 def normalize_all_jsons(progress_callback=None):
-    """모든 JSON 정규화 (JSON → CSV)"""
-    json_files = list(SERVER_OUTPUT_DIR.glob("*.json"))
-    json_files = [f for f in json_files if not f.name.startswith('batch_')]
+    """
+    모든 JSON 정규화 (JSON → CSV)
+
+    Returns:
+        (통계 dict, normalizer.data) - 실패 시 (None, None)
+    """
+    try:
+        json_files = sorted(
+            Path(e.path) for e in os.scandir(SERVER_OUTPUT_DIR)
+            if e.name.endswith('.json') and not e.name.startswith('batch_')
+            and e.is_file(follow_symlinks=False)
+        )
+    except FileNotFoundError:
+        json_files = []
 
     if not json_files:
         st.error(f"❌ {SERVER_OUTPUT_DIR}에 JSON 파일이 없습니다.")
-        return None
+        return None, None
 
     if progress_callback:
         progress_callback(f"📋 {len(json_files)}개 JSON 파일 발견")
 
     try:
-        # 모든 JSON 로드
-        all_json_data = []
-        for i, json_file in enumerate(json_files, 1):
-            if progress_callback:
-                progress_callback(f"📂 JSON 로드 중: {json_file.name} ({i}/{len(json_files)})")
-
-            with open(json_file, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
-                all_json_data.append((json_file, json_data))
-
-        if not all_json_data:
-            st.error("❌ 로드된 JSON이 없습니다.")
-            return None
-
-        # DB 연결 (PLAN_ID 매칭용 - 선택적)
-        db_manager = None
+        # 기존 PLAN_DATA 일괄 조회 (PLAN_ID 매칭용 - 선택적)
+        # 정규화 루프 전에 한 번만 조회
+        existing_plan_data = {}
         if DB_AVAILABLE:
             try:
-                db_manager = OracleDBManager(ORACLE_CONFIG)
-                db_manager.connect()
-                st.success("🔗 DB 연결 성공 (PLAN_ID 매칭용)")
+                # 읽기(BICS) 연결만 사용 - DB 적재 옵션/BICS_DEV 상태와 무관하게 매칭
+                with _open_db_manager(ORACLE_CONFIG) as db_manager:
+                    existing_plan_data = load_existing_plan_data(db_manager)
+                st.success(f"🔗 DB 연결 성공 (PLAN_ID 매칭용, 기존 {len(existing_plan_data):,}건)")
             except Exception as e:
                 st.warning(f"⚠️ DB 연결 실패 (신규 PLAN_ID로 생성): {e}")
-                db_manager = None
 
-        # 첫 번째 파일로 normalizer 초기화
         if progress_callback:
             progress_callback("📋 데이터 정규화 시작...")
 
+        # 결과 병합용 normalizer (파일별 정규화는 워커 프로세스에서 수행)
         normalizer = GovernmentStandardNormalizer(
             str(json_files[0]),
             str(SERVER_NORMALIZED_DIR),
-            db_manager=db_manager
+            existing_plan_data={}
         )
 
-        # 각 JSON 파일별로 처리
-        for json_file, json_data in all_json_data:
-            if progress_callback:
-                progress_callback(f"📋 정규화 중: {json_file.name}")
-
-            # 파일명에서 연도 추출
-            filename = json_file.stem
-            year_match = re.search(r'(20\d{2})', filename)
-
-            if year_match:
-                doc_year = int(year_match.group(1))
-                normalizer.current_context['document_year'] = doc_year
-                normalizer.current_context['performance_year'] = doc_year - 1
-                normalizer.current_context['plan_year'] = doc_year
-
-            normalizer.normalize(json_data)
+        # 파일별 병렬 정규화 → 파일 순서대로 병합 (ID/TEMP PLAN_ID가 순차 처리와 같은 순서로 부여됨)
+        # 캐시 조회/저장은 이 스크립트 스레드에서 하고, 캐시 미스만 프로세스 풀에서 정규화
+        cache = _get_normalize_cache()
+        plan_data_key = _plan_data_fingerprint(existing_plan_data)
+        version = _normalizer_version()
+        cache_keys = []
+        pending = {}
+        for idx, json_file in enumerate(json_files):
+            stat = json_file.stat()
+            key = (str(json_file), stat.st_mtime, stat.st_size, plan_data_key, version)
+            cache_keys.append(key)
+            data = cache.get(key)
+            if data is not None:
+                pending[idx] = data
+
+        misses = [idx for idx in range(len(json_files)) if idx not in pending]
+        next_idx = 0
+
+        def merge_ready():
+            nonlocal next_idx
+            while next_idx in pending:
+                data = pending.pop(next_idx)
+                json_name = json_files[next_idx].name
+                next_idx += 1
+                if isinstance(data, Exception):
+                    st.warning(f"⚠️ 정규화 실패: {json_name} ({data})")
+                else:
+                    normalizer.merge(data)
+
+        merge_ready()
+
+        if misses:
+            max_workers = min(os.cpu_count() or 1, len(misses))
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=init_normalize_worker,
+                initargs=(existing_plan_data,)
+            ) as process_pool:
+                futures = {
+                    process_pool.submit(
+                        normalize_json_file, str(json_files[idx]), str(SERVER_NORMALIZED_DIR)
+                    ): idx
+                    for idx in misses
+                }
+
+                for done, future in enumerate(as_completed(futures), 1):
+                    idx = futures[future]
+                    try:
+                        result = future.result()
+                        if result['status'] != 'success':
+                            raise RuntimeError(result.get('error') or '정규화 실패')
+                        # 병합 전에 저장 (merge가 레코드를 수정하므로)
+                        cache.put(cache_keys[idx], result['data'])
+                        pending[idx] = result['data']
+                    except Exception as e:
+                        pending[idx] = e
+                    if progress_callback:
+                        progress_callback(f"📋 정규화 중: {json_files[idx].name} ({done}/{len(misses)})")
+
+                    merge_ready()
 
         # CSV 저장
         if progress_callback:
             progress_callback("💾 CSV 저장 중...")
+            _flush_progress(progress_callback)
 
         normalizer.save_to_csv()
+        _list_table_csvs.clear()
 
-        # DB 연결 종료
-        if db_manager:
-            db_manager.close()
-
-        # 통계
+        # 통계 (정규화 데이터는 DB 적재에 바로 넘길 수 있도록 함께 반환)
         stats = {
             'plan_data': len(normalizer.data['plan_data']),
             'budgets': len(normalizer.data['budgets']),
@@ -198,67 +445,180 @@ def normalize_all_jsons(progress_callback=None):
             'achievements': len(normalizer.data['achievements'])
         }
 
-        return stats
+        return stats, normalizer.data
 
     except Exception as e:
         st.error(f"❌ 정규화 실패: {e}")
-        import traceback
-        st.code(traceback.format_exc())
-        return None
+        _show_traceback(e)
+        return None, None
 
 
-def load_to_oracle(progress_callback=None):
-    """Oracle DB 적재 (CSV → DB)"""
+@contextmanager
+def _open_db_manager(db_config):
+    """
+    OracleDBManager 1개를 열고 작업 후 닫음 (연결은 커넥션 풀에서 획득/반환)
+
+    세션 간에 연결/상태를 공유하지 않도록 호출마다 새로 연다.
+    """
+    _, OracleDBManager = _get_oracle()
+    db_manager = OracleDBManager(db_config)
+    db_manager.connect()
+    try:
+        yield db_manager
+    finally:
+        db_manager.close()
+
+
+@contextmanager
+def _open_oracle_loader(chunk_size: int):
+    """
+    적재 1회용 Oracle loader (읽기/쓰기 연결 포함)
+
+    load_stats/existing_plan_data 등 실행 상태가 다른 브라우저 세션과 섞이지 않도록
+    호출마다 새로 만들고, 연결은 커넥션 풀에서 획득/반환한다.
+    """
+    OracleDirectLoader, _ = _get_oracle()
+    loader = OracleDirectLoader(
+        db_config_read=ORACLE_CONFIG,
+        db_config_write=ORACLE_CONFIG_DEV,
+        csv_dir=str(SERVER_NORMALIZED_DIR),
+        chunk_size=chunk_size
+    )
+    try:
+        loader.connect()
+        yield loader
+    finally:
+        loader.close()
+
+
+# ORA 에러 코드별 안내 메시지
+ORACLE_ERROR_MESSAGES = {
+    'ORA-00001': "중복 키 에러: 이미 같은 데이터가 존재합니다. DB 초기화 후 재시도하세요.",
+    'ORA-02291': "FK 제약 위반: 부모 키(PLAN_ID)를 찾을 수 없습니다.",
+    'ORA-12541': "Oracle 서버 연결 실패: 서버가 실행 중인지 확인하세요.",
+}
+
+
+def _describe_oracle_error(error: Exception) -> str:
+    """DB 적재 예외를 사용자 안내 메시지로 변환 (예외를 다시 감싸지 않고 표시 시점에만 해석)"""
+    error_msg = str(error)
+    for code, message in ORACLE_ERROR_MESSAGES.items():
+        if code in error_msg:
+            return message
+    return f"Oracle DB 적재 실패: {error_msg}"
+
+
+def load_to_oracle(progress_callback=None, chunk_size=50000, data=None):
+    """
+    Oracle DB 적재
+
+    data(normalizer.data)가 있으면 메모리에서 바로 적재하고, 없으면 CSV를 읽어 적재한다.
+    예외는 그대로 전파되며, 호출 측에서 _describe_oracle_error로 메시지를 만든다.
+    """
     if not DB_AVAILABLE:
         st.error("❌ DB 모듈이 로드되지 않았습니다.")
         return None
 
-    try:
-        csv_files = list(SERVER_NORMALIZED_DIR.glob("TB_PLAN_*.csv"))
+    if data is None:
+        csv_files = _list_table_csvs(str(SERVER_NORMALIZED_DIR))
         if not csv_files:
             raise FileNotFoundError(f"CSV 파일이 없습니다: {SERVER_NORMALIZED_DIR}")
-
         if progress_callback:
             progress_callback(f"🔌 Oracle DB 연결 중... ({len(csv_files)}개 CSV 발견)")
+    elif progress_callback:
+        progress_callback("🔌 Oracle DB 연결 중...")
 
-        loader = OracleDirectLoader(
-            db_config_read=ORACLE_CONFIG,
-            db_config_write=ORACLE_CONFIG_DEV,
-            csv_dir=str(SERVER_NORMALIZED_DIR)
-        )
-
-        loader.connect()
-
+    with _open_oracle_loader(chunk_size) as loader:
         if progress_callback:
             progress_callback("🔍 기존 TB_PLAN_DATA와 매칭 중...")
+            _flush_progress(progress_callback)
 
-        loader.load_with_matching()
-        loader.close()
+        if data is None:
+            loader.load_with_matching()
+        else:
+            loader.load_from_dict(data)
 
         return loader.load_stats
 
-    except Exception as e:
-        error_msg = str(e)
-        
-        # ORA 에러 해석
-        if "ORA-00001" in error_msg:
-            raise Exception("중복 키 에러: 이미 같은 데이터가 존재합니다. DB 초기화 후 재시도하세요.")
-        elif "ORA-02291" in error_msg:
-            raise Exception("FK 제약 위반: 부모 키(PLAN_ID)를 찾을 수 없습니다.")
-        elif "ORA-12541" in error_msg:
-            raise Exception("Oracle 서버 연결 실패: 서버가 실행 중인지 확인하세요.")
-        else:
-            raise Exception(f"Oracle DB 적재 실패: {error_msg}")
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _list_table_csvs(csv_dir: str) -> list:
+    """TB_PLAN_*.csv 목록 (scandir 1회, 탭 전환 시 짧게 캐시 - 정규화 후에는 명시적으로 비움)"""
+    try:
+        return sorted(
+            e.path for e in os.scandir(csv_dir)
+            if e.name.startswith("TB_PLAN_") and e.name.endswith(".csv")
+            and e.is_file(follow_symlinks=False)
+        )
+    except FileNotFoundError:
+        return []
+
+
+def _file_stamp(path: Path) -> tuple:
+    """캐시 키용 파일 상태 (mtime, size) - 같은 초 안에 다시 쓰여도 크기로 구분"""
+    stat = path.stat()
+    return (stat.st_mtime, stat.st_size)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _count_csv_rows(path: str, stamp: tuple) -> int:
+    """CSV 데이터 행 수 (헤더 제외) - csv.reader로 파일 전체를 파싱해 레코드 수를 셈 (DataFrame은 만들지 않음), 파일 변경 시 재계산
+
+    TASK_CONTENT 등 따옴표 안에 줄바꿈이 있어 단순 개행 수로는 세지 않음
+    """
+    with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+        return max(sum(1 for _ in csv.reader(f)) - 1, 0)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _load_csv_cached(path: str, stamp: tuple, nrows: Optional[int] = None) -> pd.DataFrame:
+    """CSV 로드 (stamp(mtime, size)가 키에 포함되어 파일이 다시 쓰이면 자동 무효화)
+
+    전체 읽기는 Arrow CSV reader(멀티스레드) 우선, 미리보기(nrows)는 pandas로 앞부분만 읽음
+    """
+    if nrows is None:
+        table = read_csv_arrow(path)
+        if table is not None:
+            return table.to_pandas()
+    return pd.read_csv(path, encoding='utf-8-sig', nrows=nrows)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_unmatched_report(path: str, stamp: tuple) -> pd.DataFrame:
+    """매칭 실패 리포트 로드 - 반복되는 문자열 컬럼은 category로 변환 (메모리/비교 비용 절감)"""
+    df = _load_csv_cached(path, stamp)
+    category_cols = {c: 'category' for c in UNMATCHED_CATEGORY_COLUMNS if c in df.columns}
+    return df.astype(category_cols)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _read_bytes_cached(path: str, stamp: tuple) -> bytes:
+    """다운로드용 파일 바이트 (stamp 기준 캐시)"""
+    return Path(path).read_bytes()
+
+
+@st.fragment
+def _render_csv_download(csv_file: Path, stamp: tuple):
+    """CSV 다운로드 버튼 (디스크의 CSV를 그대로 전달 - 재직렬화 없음, BOM 포함)
+
+    파일 바이트는 "다운로드 준비"를 누른 뒤에만 읽음 (매 rerun마다 읽지 않도록)
+    """
+    ready_key = f"download_ready_{csv_file.name}"
+    if st.session_state.get(ready_key) or st.button(
+        f"📦 {csv_file.stem} 다운로드 준비", key=f"prepare_{csv_file.name}"
+    ):
+        st.session_state[ready_key] = True
+        st.download_button(
+            label=f"📥 {csv_file.stem} 다운로드",
+            data=_read_bytes_cached(str(csv_file), stamp),
+            file_name=csv_file.name,
+            mime='text/csv'
+        )
 
 
 def display_csv_data(csv_dir):
     """CSV 데이터 표시"""
-    csv_path = Path(csv_dir)
-    if not csv_path.exists():
-        st.warning("❌ CSV 파일이 없습니다.")
-        return
-
-    csv_files = [f for f in csv_path.glob("*.csv") if f.name.startswith("TB_PLAN_")]
+    csv_files = [Path(p) for p in _list_table_csvs(str(csv_dir))]
     if not csv_files:
         st.warning("❌ CSV 파일이 없습니다.")
         return
@@ -270,28 +630,149 @@ def display_csv_data(csv_dir):
     for tab, csv_file in zip(tabs, csv_files):
         with tab:
             try:
-                df = pd.read_csv(csv_file, encoding='utf-8-sig')
-                st.write(f"**{csv_file.stem}** - {len(df):,}건")
-                
-                # 처음 100개만 표시
-                st.dataframe(df.head(100), use_container_width=True)
-                
-                if len(df) > 100:
-                    st.info(f"ℹ️ 전체 {len(df):,}건 중 100건만 표시됨")
-
-                # 다운로드 버튼
-                csv_data = df.to_csv(index=False, encoding='utf-8-sig').encode('utf-8-sig')
-                st.download_button(
-                    label=f"📥 {csv_file.stem} 다운로드",
-                    data=csv_data,
-                    file_name=csv_file.name,
-                    mime='text/csv'
-                )
+                stamp = _file_stamp(csv_file)
+                total_rows = _count_csv_rows(str(csv_file), stamp)
+                st.write(f"**{csv_file.stem}** - {total_rows:,}건")
+
+                # 처음 100개만 읽어서 표시
+                df = _load_csv_cached(str(csv_file), stamp, nrows=100)
+                st.dataframe(df, use_container_width=True)
+
+                if total_rows > 100:
+                    st.info(f"ℹ️ 전체 {total_rows:,}건 중 100건만 표시됨")
+
+                # 다운로드 버튼 (fragment - 클릭 시 이 영역만 rerun)
+                _render_csv_download(csv_file, stamp)
 
             except Exception as e:
                 st.error(f"❌ 파일 로드 실패: {e}")
 
 
+@st.fragment
+def _render_results_tab():
+    """처리 결과 탭 (fragment - 탭 내부 상호작용 시 이 영역만 rerun)"""
+    st.header("처리 결과")
+
+    if st.session_state.processing_results:
+        results = st.session_state.processing_results
+        success = [r for r in results if r.status == 'success']
+        failed = [r for r in results if r.status == 'failed']
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("총 파일", len(results))
+        with col2:
+            st.metric("성공", len(success))
+        with col3:
+            st.metric("실패", len(failed))
+
+        if success:
+            st.subheader("✅ 성공")
+            success_df = pd.DataFrame(
+                [{'파일': r.file, '페이지': r.pages} for r in success]
+            )
+            st.dataframe(success_df, use_container_width=True, hide_index=True)
+
+        if failed:
+            st.subheader("❌ 실패")
+            failed_df = pd.DataFrame(
+                [{'파일': r.file, '오류': r.error or '알 수 없는 오류'} for r in failed]
+            )
+            st.dataframe(
+                failed_df.style.apply(lambda row: ['background-color: #fdecea'] * len(row), axis=1),
+                use_container_width=True,
+                hide_index=True
+            )
+
+            tracebacks = [f"# {r.file}\n{r.traceback}" for r in failed if r.traceback]
+            if tracebacks:
+                with st.expander("🔍 상세 오류", expanded=False):
+                    st.code('\n'.join(tracebacks))
+
+        if st.session_state.normalized_stats:
+            st.subheader("📊 정규화 통계")
+            stats = st.session_state.normalized_stats
+
+            cols = st.columns(5)
+            with cols[0]:
+                st.metric("메인 데이터", stats['plan_data'])
+            with cols[1]:
+                st.metric("예산", stats['budgets'])
+            with cols[2]:
+                st.metric("일정", stats['schedules'])
+            with cols[3]:
+                st.metric("성과", stats['performances'])
+            with cols[4]:
+                st.metric("대표성과", stats['achievements'])
+    else:
+        st.info("ℹ️ 아직 처리된 결과가 없습니다.")
+
+
+@st.fragment
+def _render_csv_tab():
+    """CSV 데이터 탭 (fragment)"""
+    st.header("CSV 데이터")
+    st.markdown("""
+    **📋 테이블 구조:**
+    - **TB_PLAN_DATA**: 내역사업 메인 정보
+    - **TB_PLAN_BUDGET**: 연도별 예산 상세
+    - **TB_PLAN_SCHEDULE**: 일정 상세
+    - **TB_PLAN_PERFORMANCE**: 성과 상세
+    - **TB_PLAN_ACHIEVEMENTS**: 대표성과
+    """)
+
+    display_csv_data(SERVER_NORMALIZED_DIR)
+
+
+@st.fragment
+def _render_db_stats_tab(enable_db_load: bool):
+    """DB 통계 탭 (fragment)"""
+    st.header("Oracle DB 통계")
+
+    if st.session_state.db_stats:
+        stats = st.session_state.db_stats
+
+        cols = st.columns(4)
+        with cols[0]:
+            st.metric("총 적재", f"{stats['total_records']:,}건")
+        with cols[1]:
+            st.metric("✅ 매칭 성공", f"{stats.get('matched', 0)}건")
+        with cols[2]:
+            st.metric("❌ 매칭 실패", f"{stats.get('unmatched', 0)}건")
+        with cols[3]:
+            st.metric("⚠️ 차이점", f"{stats.get('diff_found', 0)}건")
+
+        if stats.get('unmatched', 0) > 0:
+            st.warning(f"⚠️ 매칭 실패 {stats['unmatched']}건 - 신규 사업으로 추정됩니다.")
+
+            # 매칭 실패 리포트 표시
+            unmatched_csv = SERVER_NORMALIZED_DIR / "matching_reports" / "unmatched_records.csv"
+            if unmatched_csv.exists():
+                with st.expander("📄 매칭 실패 레코드"):
+                    df = _load_unmatched_report(str(unmatched_csv), _file_stamp(unmatched_csv))
+                    # 표시할 컬럼/행만 잘라서 전달 (전체 DataFrame을 Arrow로 직렬화하지 않도록)
+                    display_cols = [c for c in UNMATCHED_DISPLAY_COLUMNS if c in df.columns]
+                    st.dataframe(df.loc[:, display_cols].head(UNMATCHED_DISPLAY_ROWS),
+                                 use_container_width=True)
+                    if len(df) > UNMATCHED_DISPLAY_ROWS:
+                        st.caption(f"ℹ️ 전체 {len(df):,}건 중 {UNMATCHED_DISPLAY_ROWS}건만 표시됨 "
+                                   f"(전체는 matching_reports/unmatched_records.csv 참고)")
+
+        st.subheader("📊 테이블별 통계")
+        if 'records_by_table' in stats:
+            records_by_table = stats['records_by_table']
+            table_data = {
+                '테이블': list(records_by_table.keys()),
+                '레코드 수': [f"{v:,}건" for v in records_by_table.values()]
+            }
+            st.dataframe(pd.DataFrame(table_data), use_container_width=True)
+
+    else:
+        st.info("ℹ️ DB 적재 통계가 없습니다.")
+        if not enable_db_load:
+            st.warning("⚠️ 'Oracle DB 적재' 옵션이 비활성화되어 있습니다.")
+
+
 def main():
     """메인 UI"""
     
@@ -313,6 +794,16 @@ def main():
         if not DB_AVAILABLE:
             st.warning("⚠️ DB 모듈 미로드")
 
+        chunk_size = st.slider(
+            "📦 DB INSERT 배치 크기",
+            min_value=1000,
+            max_value=100000,
+            value=50000,
+            step=1000,
+            disabled=not enable_db_load,
+            help="executemany 1회당 INSERT 행 수"
+        )
+
         st.markdown("---")
 
         if DB_AVAILABLE:
@@ -325,29 +816,39 @@ def main():
             # DB 초기화 버튼
             if st.button("🗑️ BICS_DEV 하위테이블 초기화", type="secondary"):
                 try:
-                    with st.spinner("초기화 중..."):
-                        loader = OracleDirectLoader(
-                            db_config_read=ORACLE_CONFIG,
-                            db_config_write=ORACLE_CONFIG_DEV,
-                            csv_dir=str(SERVER_NORMALIZED_DIR)
-                        )
-                        loader.connect()
-                        
-                        cursor = loader.db_manager_write.connection.cursor()
+                    with st.spinner("초기화 중..."), _open_db_manager(ORACLE_CONFIG_DEV) as db_manager:
+                        cursor = db_manager.connection.cursor()
                         tables = ['TB_PLAN_ACHIEVEMENTS', 'TB_PLAN_PERFORMANCE', 
                                  'TB_PLAN_SCHEDULE', 'TB_PLAN_BUDGET']
                         
+                        # 하위(leaf) 테이블이므로 TRUNCATE로 즉시 비움 (DDL, 테이블마다 자동 커밋)
+                        # TRUNCATE는 앞선 DML도 커밋하므로 모든 TRUNCATE 시도가 끝난 뒤
+                        # 실패한 테이블만 DELETE로 비우고 한 트랜잭션으로 커밋 (하나라도 실패하면 전체 롤백)
+                        fallback = []
                         for table in tables:
                             try:
-                                cursor.execute(f"DELETE FROM {table}")
-                                loader.db_manager_write.connection.commit()
-                                st.success(f"✅ {table} 삭제 완료")
+                                cursor.execute(f"TRUNCATE TABLE {table}")
+                                st.success(f"✅ {table} 초기화 완료")
                             except Exception as e:
-                                st.warning(f"⚠️ {table}: {e}")
-                        
+                                st.info(f"ℹ️ {table}: TRUNCATE 실패, DELETE로 대체 ({e})")
+                                fallback.append(table)
+
+                        if fallback:
+                            deleted = {}
+                            try:
+                                for table in fallback:
+                                    cursor.execute(f"DELETE FROM {table}")
+                                    deleted[table] = cursor.rowcount
+                                db_manager.connection.commit()
+                            except Exception as e:
+                                db_manager.connection.rollback()
+                                st.warning(f"⚠️ DELETE 실패로 롤백 ({', '.join(fallback)}): {e}")
+                            else:
+                                for table, count in deleted.items():
+                                    st.success(f"✅ {table} 삭제 완료 ({count:,}건)")
+
                         cursor.close()
-                        loader.close()
-                        
+
                 except Exception as e:
                     st.error(f"❌ 초기화 실패: {e}")
 
@@ -377,8 +878,7 @@ def main():
             st.success(f"✅ {len(uploaded_files)}개 파일 선택됨")
 
             with st.expander("📋 선택된 파일", expanded=True):
-                for file in uploaded_files:
-                    st.write(f"- {file.name} ({file.size:,} bytes)")
+                st.markdown('\n'.join(f"- {file.name} ({file.size:,} bytes)" for file in uploaded_files))
 
             col1, col2 = st.columns([3, 1])
 
@@ -402,27 +902,32 @@ def main():
                 start_time = time.time()
 
                 try:
-                    # 1단계: 파일 저장
-                    status_text.text("💾 파일 저장 중...")
-                    saved_files = save_uploaded_files(uploaded_files)
-                    progress_bar.progress(0.1)
-
-                    # 2단계: PDF → JSON
-                    status_text.text("📄 PDF 파싱 중...")
-                    results = []
-                    for i, pdf_file in enumerate(saved_files):
-                        result = process_single_pdf(pdf_file, lambda msg: status_text.text(msg))
-                        results.append(result)
-                        
-                        if result['status'] == 'success':
-                            st.success(f"✅ {result['file']}: {result['pages']}페이지")
+                    # 1~2단계: 파일 저장 + PDF → JSON (저장된 파일부터 바로 파싱 시작)
+                    status_text.text("💾 파일 저장 및 PDF 파싱 중...")
+                    total_files = len(uploaded_files)
+                    update_status = _throttle(status_text.text)
+                    last_update = time.monotonic()
+
+                    def on_pdf_done(done, result):
+                        nonlocal last_update
+                        if result.status == 'success':
+                            st.success(f"✅ {result.file}: {result.pages}페이지")
                         else:
-                            st.error(f"❌ {result['file']}: {result.get('error', '알 수 없는 오류')}")
-                        
-                        progress_bar.progress(0.1 + 0.4 * (i + 1) / len(saved_files))
+                            st.error(f"❌ {result.file}: {result.error or '알 수 없는 오류'}")
+
+                        # 진행률은 일정 간격 또는 마지막 파일에서만 갱신
+                        now = time.monotonic()
+                        if now - last_update >= PROGRESS_UPDATE_INTERVAL or done == total_files:
+                            progress_bar.progress(0.5 * done / total_files)
+                            last_update = now
+                        update_status(f"📄 PDF 파싱 중... ({done}/{total_files}) {result.file}")
+                        if done == total_files:
+                            update_status.flush()
+
+                    results = process_pdfs_parallel(uploaded_files, on_pdf_done)
 
                     st.session_state.processing_results = results
-                    success_count = sum(1 for r in results if r['status'] == 'success')
+                    success_count = sum(1 for r in results if r.status == 'success')
 
                     if success_count == 0:
                         st.error("❌ 모든 파일 처리 실패")
@@ -430,7 +935,7 @@ def main():
 
                     # 3단계: JSON → CSV 정규화
                     status_text.text("📋 데이터 정규화 중...")
-                    norm_stats = normalize_all_jsons(lambda msg: status_text.text(msg))
+                    norm_stats, normalized_data = normalize_all_jsons(_throttle(status_text.text))
                     st.session_state.normalized_stats = norm_stats
                     progress_bar.progress(0.7)
 
@@ -448,14 +953,16 @@ def main():
                     if enable_db_load and DB_AVAILABLE:
                         status_text.text("🗄️ Oracle DB 적재 중...")
                         try:
-                            db_stats = load_to_oracle(lambda msg: status_text.text(msg))
+                            db_stats = load_to_oracle(
+                                _throttle(status_text.text), chunk_size, data=normalized_data
+                            )
                             st.session_state.db_stats = db_stats
                             progress_bar.progress(1.0)
                             
                             if db_stats:
                                 st.success(f"✅ DB 적재 완료: {db_stats['total_records']}건")
                         except Exception as db_error:
-                            st.error(f"❌ DB 적재 실패: {db_error}")
+                            st.error(f"❌ DB 적재 실패: {_describe_oracle_error(db_error)}")
                             st.warning("⚠️ CSV 파일은 정상 생성되었습니다.")
                     else:
                         progress_bar.progress(1.0)
@@ -467,105 +974,16 @@ def main():
 
                 except Exception as e:
                     st.error(f"❌ 처리 실패: {e}")
-                    import traceback
-                    st.code(traceback.format_exc())
+                    _show_traceback(e)
 
     with tab2:
-        st.header("처리 결과")
-
-        if st.session_state.processing_results:
-            results = st.session_state.processing_results
-            success = [r for r in results if r['status'] == 'success']
-            failed = [r for r in results if r['status'] == 'failed']
-
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("총 파일", len(results))
-            with col2:
-                st.metric("성공", len(success))
-            with col3:
-                st.metric("실패", len(failed))
-
-            if success:
-                st.subheader("✅ 성공")
-                for r in success:
-                    st.write(f"- {r['file']} ({r.get('pages', 0)}페이지)")
-
-            if failed:
-                st.subheader("❌ 실패")
-                for r in failed:
-                    st.error(f"- {r['file']}: {r.get('error', '알 수 없는 오류')}")
-
-            if st.session_state.normalized_stats:
-                st.subheader("📊 정규화 통계")
-                stats = st.session_state.normalized_stats
-                
-                cols = st.columns(5)
-                with cols[0]:
-                    st.metric("메인 데이터", stats['plan_data'])
-                with cols[1]:
-                    st.metric("예산", stats['budgets'])
-                with cols[2]:
-                    st.metric("일정", stats['schedules'])
-                with cols[3]:
-                    st.metric("성과", stats['performances'])
-                with cols[4]:
-                    st.metric("대표성과", stats['achievements'])
-        else:
-            st.info("ℹ️ 아직 처리된 결과가 없습니다.")
+        _render_results_tab()
 
     with tab3:
-        st.header("CSV 데이터")
-        st.markdown("""
-        **📋 테이블 구조:**
-        - **TB_PLAN_DATA**: 내역사업 메인 정보
-        - **TB_PLAN_BUDGET**: 연도별 예산 상세
-        - **TB_PLAN_SCHEDULE**: 일정 상세
-        - **TB_PLAN_PERFORMANCE**: 성과 상세
-        - **TB_PLAN_ACHIEVEMENTS**: 대표성과
-        """)
-
-        if SERVER_NORMALIZED_DIR.exists():
-            display_csv_data(SERVER_NORMALIZED_DIR)
-        else:
-            st.info("ℹ️ CSV 데이터가 없습니다.")
+        _render_csv_tab()
 
     with tab4:
-        st.header("Oracle DB 통계")
-
-        if st.session_state.db_stats:
-            stats = st.session_state.db_stats
-
-            cols = st.columns(4)
-            with cols[0]:
-                st.metric("총 적재", f"{stats['total_records']:,}건")
-            with cols[1]:
-                st.metric("✅ 매칭 성공", f"{stats.get('matched', 0)}건")
-            with cols[2]:
-                st.metric("❌ 매칭 실패", f"{stats.get('unmatched', 0)}건")
-            with cols[3]:
-                st.metric("⚠️ 차이점", f"{stats.get('diff_found', 0)}건")
-
-            if stats.get('unmatched', 0) > 0:
-                st.warning(f"⚠️ 매칭 실패 {stats['unmatched']}건 - 신규 사업으로 추정됩니다.")
-                
-                # 매칭 실패 리포트 표시
-                unmatched_csv = SERVER_NORMALIZED_DIR / "matching_reports" / "unmatched_records.csv"
-                if unmatched_csv.exists():
-                    with st.expander("📄 매칭 실패 레코드"):
-                        df = pd.read_csv(unmatched_csv, encoding='utf-8-sig')
-                        st.dataframe(df, use_container_width=True)
-
-            st.subheader("📊 테이블별 통계")
-            if 'records_by_table' in stats:
-                table_data = [{'테이블': k, '레코드 수': f"{v:,}건"} 
-                             for k, v in stats['records_by_table'].items()]
-                st.dataframe(pd.DataFrame(table_data), use_container_width=True)
-
-        else:
-            st.info("ℹ️ DB 적재 통계가 없습니다.")
-            if not enable_db_load:
-                st.warning("⚠️ 'Oracle DB 적재' 옵션이 비활성화되어 있습니다.")
+        _render_db_stats_tab(enable_db_load)
 
     # 푸터
     st.markdown("---")